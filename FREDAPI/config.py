@@ -3,7 +3,10 @@ Configuration settings for the Bond Curve Builder application.
 """
 import os
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Optional, Tuple
+
+import numpy as np
 
 # Base directory
 BASE_DIR = Path(__file__).parent
@@ -11,6 +14,21 @@ BASE_DIR = Path(__file__).parent
 # Database configuration
 DATABASE_PATH = BASE_DIR / "database" / "curves.db"
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+DATABASE_INSERT_PAGE_SIZE = 10000  # Rows per multi-row INSERT when executemany is batched
+DATABASE_BATCH_PAGE_SIZE = 500  # Statements per psycopg2 execute_batch page (UPDATEs)
+DATABASE_POOL_SIZE = 16  # Connections kept open per process
+DATABASE_MAX_OVERFLOW = 32  # Extra connections allowed under bursts
+DATABASE_POOL_RECYCLE = 1800  # Seconds before a server connection is replaced
+
+# Applied to every new SQLite connection. WAL lets readers proceed while the
+# refresh writes; the rest trade durability on power loss for throughput.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
 
 # Logging configuration
 LOG_DIR = BASE_DIR / "logs"
@@ -20,6 +38,34 @@ LOG_LEVEL = "INFO"
 # API Configuration
 API_HOST = "0.0.0.0"
 API_PORT = 8000
+API_WORKERS = os.cpu_count() or 1  # Uvicorn worker processes
+API_ACCESS_LOG = False  # Per-request access logging (costly on small endpoints)
+
+# HTTP caching for curve endpoints addressed by date. A refresh re-fetches and
+# rebuilds at most the last REFRESH_LOOKBACK_DAYS (30) days, so only dates
+# older than that are immutable.
+HTTP_CACHE_IMMUTABLE_AFTER_DAYS = 30
+HTTP_CACHE_MAX_AGE = 31536000  # 1 year for immutable historical curves
+HTTP_CACHE_RECENT_MAX_AGE = 300  # 5 minutes for curves still subject to revision
+# Part of the ETag of immutable curves together with the interpolation method.
+# Bump it whenever a change to bootstrapping or validation alters stored curves.
+CURVE_DATA_VERSION = 2
+
+# Fitted splines kept per API worker for the yield-at-maturity endpoints,
+# keyed by curve type and date. An entry holds the coefficients of a full
+# daily curve, about 1 MB, so this bounds each worker to ~128 MB.
+SPLINE_CACHE_SIZE = 128
+
+# In-process cache of curve responses per API worker. Entries are dropped
+# whenever a refresh completes; the TTLs only bound staleness otherwise.
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 86400  # Curves addressed by date
+RESPONSE_CACHE_LATEST_TTL = 300  # "latest" endpoints
+CURVE_CACHE_SIZE = 256  # Stored curves memoized per process by get_curve/get_latest_curve
+RANGE_FETCH_BATCH_SIZE = 64  # Curve rows fetched per batch by range endpoints
+RAW_FETCH_BATCH_SIZE = 1000  # Raw observation rows fetched per batch by /raw endpoints
+HEALTH_CACHE_TTL = 5  # Seconds a /health response is reused
+YIELD_BATCH_MAX_MATURITIES = 10000  # Maturities accepted by one /yield/batch request
 API_TITLE = "Treasury & Corporate Bond Curve API"
 API_VERSION = "1.0.0"
 API_DESCRIPTION = """
@@ -34,9 +80,28 @@ Features:
 
 # FRED API Configuration
 FRED_API_KEY: Optional[str] = None  # Will be set at runtime
+FRED_MAX_WORKERS = 8  # Concurrent series requests (FRED allows 120 requests/minute)
+FRED_MAX_CONCURRENT_REQUESTS = 8  # Async requests in flight across every fetch sharing an event loop
+FRED_MAX_RETRIES = 3  # Attempts per series before giving up
+FRED_RETRY_BACKOFF = 0.5  # Base delay in seconds, doubled on each retry
+FRED_PERMANENT_HTTP_STATUSES = frozenset({400, 401, 403, 404})  # Bad request, key or series: fetches fail without retrying
+FRED_MAX_VINTAGES_PER_REQUEST = 1999  # FRED rejects requests spanning 2000+ vintages
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"  # Used by the async client
+FRED_CACHE_DIR: Optional[Path] = BASE_DIR / "database" / "fred_cache"  # Fetched frames kept on disk; None disables
+FRED_CACHE_RECENT_TTL = 3600  # Seconds a fetch reaching into the current month is reused (older ones never expire)
+FRED_HTTP_TIMEOUT = 30.0  # Seconds per async request
+# FRED quotes yields to 2 decimals, well within float32 precision. Fetched
+# frames use float32 to halve their memory. Values are rounded back to
+# RAW_VALUE_DECIMALS when stored, so float32 artifacts
+# (4.35 -> 4.349999904...) never reach the database.
+FRED_VALUE_DTYPE = np.float32
+RAW_VALUE_DECIMALS = 4
+RAW_UPSERT_CHUNK_SIZE = 10000  # Observations per bulk INSERT ... ON CONFLICT statement
+RAW_COPY_MIN_ROWS = 5000  # On PostgreSQL (psycopg2), larger raw batches are streamed with COPY
+CURVE_UPSERT_CHUNK_SIZE = 100  # Curves per bulk INSERT ... ON CONFLICT and per flush of a range build (~1 MB each)
 
 # US Treasury Series IDs (FRED)
-TREASURY_SERIES = {
+TREASURY_SERIES = MappingProxyType({
     "1M": "DGS1MO",   # 1-Month
     "3M": "DGS3MO",   # 3-Month
     "6M": "DGS6MO",   # 6-Month
@@ -48,10 +113,10 @@ TREASURY_SERIES = {
     "10Y": "DGS10",   # 10-Year
     "20Y": "DGS20",   # 20-Year
     "30Y": "DGS30",   # 30-Year
-}
+})
 
 # Treasury maturity in years (for bootstrapping)
-TREASURY_MATURITIES = {
+TREASURY_MATURITIES = MappingProxyType({
     "1M": 1/12,
     "3M": 3/12,
     "6M": 6/12,
@@ -63,10 +128,10 @@ TREASURY_MATURITIES = {
     "10Y": 10,
     "20Y": 20,
     "30Y": 30,
-}
+})
 
 # Corporate Bond Index Series IDs (FRED)
-CORPORATE_SERIES = {
+CORPORATE_SERIES = MappingProxyType({
     # Moody's Seasoned AAA Corporate Bond Yield
     "AAA": "DAAA",
     # Moody's Seasoned BAA Corporate Bond Yield
@@ -87,10 +152,10 @@ CORPORATE_SERIES = {
     "CORP_10_15Y": "BAMLC7A0C1015Y",
     # ICE BofA 15+ Year US Corporate Index Effective Yield
     "CORP_15Y_PLUS": "BAMLC8A0C15PY",
-}
+})
 
 # Corporate bond maturity mapping (approximate mid-points)
-CORPORATE_MATURITIES = {
+CORPORATE_MATURITIES = MappingProxyType({
     "AAA": 10,  # Generic long-term
     "BAA": 10,  # Generic long-term
     "CORP": 8,  # General corporate index
@@ -101,16 +166,51 @@ CORPORATE_MATURITIES = {
     "CORP_7_10Y": 8.5,
     "CORP_10_15Y": 12.5,
     "CORP_15Y_PLUS": 20,
-}
+})
+
+# The series/maturity mappings above are read-only so no worker can mutate
+# shared configuration. Flat (name, series_id, maturity) tuples give an
+# order-stable iteration without repeated dict lookups.
+TREASURY_ITEMS: Tuple[Tuple[str, str, float], ...] = tuple(
+    (k, TREASURY_SERIES[k], TREASURY_MATURITIES[k]) for k in TREASURY_SERIES
+)
+CORPORATE_ITEMS: Tuple[Tuple[str, str, float], ...] = tuple(
+    (k, CORPORATE_SERIES[k], CORPORATE_MATURITIES[k]) for k in CORPORATE_SERIES
+)
+
+# Tenor order and maturities as contiguous arrays (ordered like the series dicts)
+TREASURY_TENORS: Tuple[str, ...] = tuple(TREASURY_SERIES.keys())
+TREASURY_MATURITIES_ARR = np.fromiter(
+    (TREASURY_MATURITIES[k] for k in TREASURY_TENORS),
+    dtype=np.float64,
+    count=len(TREASURY_TENORS),
+)
+CORPORATE_TENORS: Tuple[str, ...] = tuple(CORPORATE_SERIES.keys())
+CORPORATE_MATURITIES_ARR = np.fromiter(
+    (CORPORATE_MATURITIES[k] for k in CORPORATE_TENORS),
+    dtype=np.float64,
+    count=len(CORPORATE_TENORS),
+)
 
 # Data refresh schedule
 REFRESH_HOUR = 18  # 6 PM daily refresh
 REFRESH_MINUTE = 0
+REFRESH_MISFIRE_GRACE_SECONDS = 3600  # A refresh missed by up to this long (e.g. while restarting) still runs
+REFRESH_COALESCE_SECONDS = 6 * 3600  # Skip a scheduled refresh this soon after a successful one
+REFRESH_LOOKBACK_DAYS = 30  # Longest window a refresh fetches (also used when nothing is stored yet)
+REFRESH_REVISION_DAYS = 3  # Days before the latest stored observation re-fetched to pick up revisions
+ERROR_TRACEBACK_MAX_CHARS = 4000  # Characters of a failed update's traceback kept in its log
+REFRESH_MARKER_PATH = DATABASE_PATH.parent / "last_refresh.json"  # Written after each refresh
+SCHEDULER_LOCK_PATH = DATABASE_PATH.parent / "refresh_scheduler.lock"  # Held by the single refresh leader
 
 # Data processing settings
 MAX_MISSING_DATA_DAYS = 5  # Maximum consecutive days of missing data to interpolate
-BOOTSTRAPPING_INTERPOLATION_METHOD = "cubic"  # cubic spline interpolation
+BOOTSTRAPPING_INTERPOLATION_METHOD = "pchip"  # Shape-preserving cubic (no overshoot); also cubic, quadratic, linear
 MIN_DATA_POINTS = 3  # Minimum data points required for curve construction
+CURVE_DOWNSAMPLE_SIZES = (100, 300, 1000)  # max_points variants precomputed when a curve is stored
+CURVE_BUILD_WORKERS = int(os.getenv("CURVE_BUILD_WORKERS", os.cpu_count() or 1))  # Processes for range builds
+CURVE_BUILD_PARALLEL_MIN_DATES = 250  # Smaller ranges are built in-process (worker startup dominates)
+CURVE_BUILD_CHUNK_SIZE = 16  # Dates handed to a worker process at a time
 
 # Create necessary directories
 DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
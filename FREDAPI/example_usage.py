@@ -4,17 +4,29 @@ Example usage of the Bond Curve API.
 This script demonstrates how to interact with the API programmatically.
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import date, timedelta
 import json
 
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# One keep-alive session for all calls so connections are reused
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 
 def check_health():
     """Check if the API is running."""
     print("Checking API health...")
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
     print(json.dumps(response.json(), indent=2))
     print()
@@ -23,7 +35,7 @@ def check_health():
 def get_latest_treasury_curve():
     """Get the latest Treasury yield curve."""
     print("Fetching latest Treasury curve...")
-    response = requests.get(f"{BASE_URL}/treasury/latest")
+    response = SESSION.get(f"{BASE_URL}/treasury/latest")
 
     if response.status_code == 200:
         data = response.json()
@@ -39,7 +51,7 @@ def get_latest_treasury_curve():
 def get_treasury_curve_on_date(curve_date: str):
     """Get Treasury curve for a specific date."""
     print(f"Fetching Treasury curve for {curve_date}...")
-    response = requests.get(f"{BASE_URL}/treasury/{curve_date}")
+    response = SESSION.get(f"{BASE_URL}/treasury/{curve_date}")
 
     if response.status_code == 200:
         data = response.json()
@@ -54,7 +66,7 @@ def get_treasury_curve_on_date(curve_date: str):
 def get_latest_corporate_curve():
     """Get the latest Corporate bond curve."""
     print("Fetching latest Corporate curve...")
-    response = requests.get(f"{BASE_URL}/corporate/latest")
+    response = SESSION.get(f"{BASE_URL}/corporate/latest")
 
     if response.status_code == 200:
         data = response.json()
@@ -70,7 +82,7 @@ def get_latest_corporate_curve():
 def get_spread_curve(rating: str):
     """Get spread curve for a specific rating."""
     print(f"Fetching {rating} spread curve...")
-    response = requests.get(f"{BASE_URL}/corporate/spread/{rating}/latest")
+    response = SESSION.get(f"{BASE_URL}/corporate/spread/{rating}/latest")
 
     if response.status_code == 200:
         data = response.json()
@@ -84,13 +96,29 @@ def get_spread_curve(rating: str):
         print()
 
 
+def get_all_spread_curves():
+    """Get the latest spread curves for every rating in one request."""
+    print("Fetching spread curves for all ratings...")
+    response = SESSION.get(f"{BASE_URL}/corporate/spread/all/latest")
+
+    if response.status_code == 200:
+        data = response.json()
+        print(f"Date: {data['curve_date']}")
+        for rating, curve in data['spreads'].items():
+            print(f"  {rating:14} Spreads (bps): {curve['spreads']}")
+        print()
+    else:
+        print(f"Error: {response.status_code}")
+        print()
+
+
 def get_treasury_range(days_back: int = 30):
     """Get Treasury curves for a date range."""
     end_date = date.today()
     start_date = end_date - timedelta(days=days_back)
 
     print(f"Fetching Treasury curves from {start_date} to {end_date}...")
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/treasury/range/{start_date}/{end_date}"
     )
 
@@ -109,7 +137,7 @@ def get_treasury_range(days_back: int = 30):
 def get_raw_data(series: str = "10Y", data_type: str = "treasury"):
     """Get raw data for a specific series."""
     print(f"Fetching raw {data_type} data for {series}...")
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/raw/{data_type}/{series}",
         params={"limit": 10}
     )
@@ -129,7 +157,7 @@ def get_raw_data(series: str = "10Y", data_type: str = "treasury"):
 def get_available_dates():
     """Get information about available curve dates."""
     print("Fetching available dates...")
-    response = requests.get(f"{BASE_URL}/dates/available")
+    response = SESSION.get(f"{BASE_URL}/dates/available")
 
     if response.status_code == 200:
         data = response.json()
@@ -168,9 +196,8 @@ def main():
         # Get latest Corporate curve
         get_latest_corporate_curve()
 
-        # Get spread curves
-        get_spread_curve("AAA")
-        get_spread_curve("BAA")
+        # Get spread curves for all ratings in one call
+        get_all_spread_curves()
 
         # Get Treasury curves for last 30 days
         get_treasury_range(30)
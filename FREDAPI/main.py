@@ -7,18 +7,16 @@ import logging
 from pathlib import Path
 import argparse
 import getpass
-import uvicorn
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 import config
-from src.utils.logger import setup_logging
-from src.models.database import init_database
-from src.data.fred_client import FREDClient
-from src.utils.scheduler import DataRefreshScheduler
 
-logger = None
+# Heavy modules (pandas, SQLAlchemy, APScheduler, uvicorn) are imported inside
+# the functions that use them so `--help` and argument errors return instantly.
+
+logger = logging.getLogger(__name__)
 
 
 def prompt_for_api_key() -> str:
@@ -35,7 +33,7 @@ def prompt_for_api_key() -> str:
     print("Get your free API key at: https://fred.stlouisfed.org/docs/api/api_key.html")
     print()
 
-    api_key = "a143fd9d578f3d3c2193211b5e96b524"
+    api_key = os.environ.get("FRED_API_KEY") or getpass.getpass("Enter your FRED API key: ").strip()
 
     if not api_key:
         print("Error: API key cannot be empty")
@@ -44,42 +42,20 @@ def prompt_for_api_key() -> str:
     return api_key
 
 
-def validate_api_key(api_key: str) -> bool:
-    """
-    Validate FRED API key.
-
-    Args:
-        api_key: API key to validate
-
-    Returns:
-        True if valid, False otherwise
-    """
-    logger.info("Validating FRED API key...")
-
-    try:
-        client = FREDClient(api_key)
-        if client.validate_api_key():
-            logger.info("API key validated successfully")
-            return True
-        else:
-            logger.error("API key validation failed")
-            return False
-    except Exception as e:
-        logger.error(f"API key validation error: {str(e)}")
-        return False
-
-
-def initialize_system(api_key: str, skip_initial_load: bool = False) -> DataRefreshScheduler:
+def initialize_system(api_key: str, skip_initial_load: bool = False):
     """
     Initialize the system.
 
+    The scheduling itself runs in the scheduler process; the instance
+    created here only runs the initial load and is never started.
+
     Args:
         api_key: FRED API key
         skip_initial_load: Skip initial data load if True
-
-    Returns:
-        DataRefreshScheduler instance
     """
+    from src.models.database import init_database
+    from src.utils.scheduler import DataRefreshScheduler
+
     logger.info("Initializing system...")
 
     # Initialize database
@@ -89,9 +65,6 @@ def initialize_system(api_key: str, skip_initial_load: bool = False) -> DataRefr
     # Set API key in config
     config.FRED_API_KEY = api_key
 
-    # Create scheduler
-    scheduler = DataRefreshScheduler(api_key)
-
     # Run initial data load if needed
     if not skip_initial_load:
         print("\n" + "="*60)
@@ -104,7 +77,7 @@ def initialize_system(api_key: str, skip_initial_load: bool = False) -> DataRefr
         if response in ['yes', 'y']:
             logger.info("Starting initial data load...")
             print("\nLoading data... This may take a few minutes.")
-            success = scheduler.run_initial_load()
+            success = DataRefreshScheduler(api_key).run_initial_load()
 
             if success:
                 print("\n✓ Initial data load completed successfully!")
@@ -116,59 +89,111 @@ def initialize_system(api_key: str, skip_initial_load: bool = False) -> DataRefr
             logger.info("Skipping initial data load")
             print("\nSkipping initial data load.")
 
-    return scheduler
 
+def run_scheduler_process(api_key: str, log_level: str):
+    """
+    Run the daily refresh scheduler in a dedicated process.
+
+    Keeping the refresh (bulk FRED download + bootstrapping) out of the API
+    process stops it from competing with request handling for the GIL. The
+    SQLite database and the refresh marker file are the only shared state;
+    the process is spawned, so it opens its own database connections.
 
-def start_api_server(scheduler: DataRefreshScheduler):
+    Args:
+        api_key: FRED API key
+        log_level: Logging level for the scheduler process
+    """
+    import time
+    from src.utils.logger import setup_logging
+    from src.utils.scheduler import DataRefreshScheduler
+
+    setup_logging(log_level)
+    config.FRED_API_KEY = api_key
+
+    scheduler = DataRefreshScheduler(api_key)
+    scheduler.start()
+    if not scheduler.is_running:
+        return
+    logger.info("Scheduler process started")
+
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
+
+
+def start_api_server(api_key: str, log_level: str = config.LOG_LEVEL):
     """
     Start the API server.
 
     Args:
-        scheduler: DataRefreshScheduler instance
+        api_key: FRED API key passed on to the scheduler process
+        log_level: Logging level passed on to the scheduler process
     """
+    import multiprocessing
+    import uvicorn
+
     print("\n" + "="*60)
     print("Starting API Server")
     print("="*60)
     print(f"\nAPI will be available at: http://{config.API_HOST}:{config.API_PORT}")
     print(f"API Documentation: http://{config.API_HOST}:{config.API_PORT}/docs")
+    print(f"Worker processes: {config.API_WORKERS}")
     print(f"Daily data refresh scheduled for: {config.REFRESH_HOUR:02d}:{config.REFRESH_MINUTE:02d}")
     print("\nPress Ctrl+C to stop the server")
     print("="*60 + "\n")
 
-    # Start scheduler
-    scheduler.start()
-    logger.info("Scheduler started")
+    # Start scheduler in its own process. It is spawned rather than forked:
+    # a forked child would inherit the SQLite connections this process pooled
+    # during init_database and the initial load.
+    scheduler_process = multiprocessing.get_context("spawn").Process(
+        target=run_scheduler_process,
+        args=(api_key, log_level),
+        name="data-refresh-scheduler",
+        daemon=False
+    )
+    scheduler_process.start()
+    logger.info("Scheduler process started (pid %s)", scheduler_process.pid)
 
-    # Start API server
+    # Start API server. uvicorn[standard] picks uvloop and httptools
+    # automatically and falls back to asyncio/h11 where they are unavailable
+    # (e.g. uvloop on Windows).
     try:
         uvicorn.run(
             "src.api.app:app",
             host=config.API_HOST,
             port=config.API_PORT,
+            workers=config.API_WORKERS,
+            loop="auto",
+            http="auto",
             log_level="info",
-            access_log=True
+            access_log=config.API_ACCESS_LOG
         )
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
-        scheduler.stop()
         print("\n\nServer stopped.")
     except Exception as e:
-        logger.error(f"Server error: {str(e)}")
-        scheduler.stop()
+        logger.exception("Server error")
         raise
+    finally:
+        if scheduler_process.is_alive():
+            scheduler_process.terminate()
+        scheduler_process.join(timeout=10)
+        logger.info("Scheduler process stopped")
 
 
 def main():
     """Main entry point."""
-    global logger
-
     parser = argparse.ArgumentParser(
         description="Treasury & Corporate Bond Curve Builder with API"
     )
     parser.add_argument(
         "--api-key",
         type=str,
-        help="FRED API key (will prompt if not provided)"
+        help="FRED API key (falls back to $FRED_API_KEY, then prompts)"
     )
     parser.add_argument(
         "--skip-initial-load",
@@ -188,45 +213,48 @@ def main():
         default=config.API_PORT,
         help=f"API server port (default: {config.API_PORT})"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.API_WORKERS,
+        help=f"Number of API worker processes (default: {config.API_WORKERS})"
+    )
 
     args = parser.parse_args()
 
     # Setup logging
+    from src.utils.logger import setup_logging
     setup_logging(args.log_level)
-    logger = logging.getLogger(__name__)
 
     logger.info("Starting Treasury & Corporate Bond Curve Builder")
 
     # Update config with command-line args
     if args.port:
         config.API_PORT = args.port
+    if args.workers:
+        config.API_WORKERS = args.workers
 
     # Get API key
     api_key = args.api_key
     if not api_key:
         api_key = prompt_for_api_key()
 
-    # Validate API key
-    if not validate_api_key(api_key):
-        print("\n✗ Invalid API key. Please check your key and try again.")
-        logger.error("Invalid API key")
-        sys.exit(1)
-
-    print("\n✓ API key validated successfully!")
+    # The key is validated lazily by FREDClient on its first request, so
+    # startup does not block on a FRED round-trip.
 
     # Initialize system
     try:
-        scheduler = initialize_system(api_key, args.skip_initial_load)
+        initialize_system(api_key, args.skip_initial_load)
     except Exception as e:
-        logger.error(f"System initialization failed: {str(e)}")
+        logger.exception("System initialization failed")
         print(f"\n✗ System initialization failed: {str(e)}")
         sys.exit(1)
 
     # Start API server
     try:
-        start_api_server(scheduler)
+        start_api_server(api_key, args.log_level)
     except Exception as e:
-        logger.error(f"Failed to start server: {str(e)}")
+        logger.exception("Failed to start server")
         print(f"\n✗ Failed to start server: {str(e)}")
         sys.exit(1)
 
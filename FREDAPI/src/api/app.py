@@ -1,14 +1,27 @@
 """
 FastAPI application for Treasury and Corporate Bond Curve API.
 """
-from fastapi import FastAPI
+from datetime import date, timedelta
+import hashlib
+import logging
+import os
+import re
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from pathlib import Path
+from typing import Optional
 import config
 
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # pragma: no cover - optional dependency
+    BrotliMiddleware = None
+
+logger = logging.getLogger(__name__)
+
 # Create FastAPI app
 app = FastAPI(
     title=config.API_TITLE,
@@ -16,12 +29,72 @@ app = FastAPI(
     description=config.API_DESCRIPTION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson is much faster on float-heavy curves
 )
 
-# Add GZip compression middleware (compress responses > 1KB)
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add compression middleware (compress responses > 1KB).
+# Brotli is preferred when the client accepts it; BrotliMiddleware falls back to
+# gzip for everyone else. Without brotli-asgi installed, plain gzip is used.
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1000, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# Curve endpoints whose path names the curve date(s)
+CURVE_PATH_PATTERN = re.compile(r"^/api/v1/(?:treasury|corporate)/")
+PATH_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@app.middleware("http")
+async def curve_cache_headers(request: Request, call_next):
+    """
+    Add HTTP caching headers to curve endpoints addressed by date.
+
+    Curves older than the refresh window never change, so they get a
+    long-lived immutable Cache-Control and an ETag derived from the request
+    path and the version of the curve-building algorithm
+    (config.CURVE_DATA_VERSION and the interpolation method). A matching
+    If-None-Match is answered with 304 before any database work. Recent
+    curves get a short max-age only.
+    """
+    path = request.url.path
+    if request.method != "GET" or not CURVE_PATH_PATTERN.match(path):
+        return await call_next(request)
+
+    try:
+        path_dates = [date.fromisoformat(d) for d in PATH_DATE_PATTERN.findall(path)]
+    except ValueError:
+        path_dates = []
 
-# Add CORS middleware
+    if not path_dates:
+        return await call_next(request)
+
+    cutoff = date.today() - timedelta(days=config.HTTP_CACHE_IMMUTABLE_AFTER_DAYS)
+    if max(path_dates) >= cutoff:
+        response = await call_next(request)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = f"public, max-age={config.HTTP_CACHE_RECENT_MAX_AGE}"
+        return response
+
+    digest = hashlib.blake2b(
+        f"{config.API_VERSION}:{config.CURVE_DATA_VERSION}:"
+        f"{config.BOOTSTRAPPING_INTERPOLATION_METHOD}:{path}?{request.url.query}".encode(),
+        digest_size=8
+    ).hexdigest()
+    etag = f'W/"{digest}"'
+    cache_control = f"public, max-age={config.HTTP_CACHE_MAX_AGE}, immutable"
+
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
+    return response
+
+
+# Add CORS middleware (outermost, so 304 responses carry CORS headers too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -35,17 +108,22 @@ from src.api.routes import router
 app.include_router(router, prefix="/api/v1")
 
 # Mount static files
-STATIC_DIR = Path(__file__).parent.parent.parent / "static"
+STATIC_DIR = (Path(__file__).parent.parent.parent / "static").resolve()
 if STATIC_DIR.exists():
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
+# Resolve the dashboard once; passing the cached stat lets FileResponse skip
+# its own stat call on every homepage hit. Restart after editing index.html.
+_index_path = STATIC_DIR / "index.html"
+INDEX_HTML: Optional[str] = str(_index_path) if _index_path.is_file() else None
+INDEX_STAT = os.stat(INDEX_HTML) if INDEX_HTML is not None else None
+
 
 @app.get("/")
 async def root():
     """Serve the dashboard homepage."""
-    html_file = STATIC_DIR / "index.html"
-    if html_file.exists():
-        return FileResponse(str(html_file))
+    if INDEX_HTML is not None:
+        return FileResponse(INDEX_HTML, stat_result=INDEX_STAT)
     return {
         "name": config.API_TITLE,
         "version": config.API_VERSION,
@@ -60,9 +138,7 @@ async def root():
 async def startup_event():
     """Initialize on startup."""
     from src.models.database import init_database
-    import logging
 
-    logger = logging.getLogger(__name__)
     logger.info("Starting Bond Curve API...")
 
     # Initialize database
@@ -73,6 +149,4 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
-    import logging
-    logger = logging.getLogger(__name__)
     logger.info("Shutting down Bond Curve API...")
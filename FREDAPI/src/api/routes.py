@@ -1,18 +1,73 @@
 """
 API routes for Treasury and Corporate Bond Curve API.
 """
-from datetime import date, datetime
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from datetime import date, datetime, timezone
+import json
+from typing import Callable, Optional, List, Tuple
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Path
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+import numpy as np
+import orjson
 from pydantic import BaseModel, Field
 
-from src.models.database import get_db, BootstrappedCurve, CorporateSpreadCurve, RawYieldData
+import config
+from src.models.database import get_db, SessionLocal, BootstrappedCurve, CorporateSpreadCurve, RawYieldData
 from src.data.treasury_builder import TreasuryCurveBuilder
 from src.data.corporate_builder import CorporateCurveBuilder
+from src.utils.bootstrapping import ScalarSplineEvaluator, build_interpolator
+from src.utils.cache import ResponseCache
 
+# Handlers are plain functions: they use the synchronous SQLAlchemy session,
+# so FastAPI runs them in its threadpool instead of blocking the event loop.
+# Curve endpoints return the builders' dicts as ORJSONResponse directly; their
+# models are listed under `responses` for the OpenAPI docs only.
 router = APIRouter()
 
+_responses = ResponseCache(config.RESPONSE_CACHE_SIZE)
+_splines = ResponseCache(config.SPLINE_CACHE_SIZE)
+
+
+def _get_curve_spline(
+    curve_type: str,
+    curve_date: date,
+    load_points: Callable[[], Tuple[List[float], List[float]]]
+):
+    """
+    Fit the interpolator for a stored curve, caching it across requests.
+
+    Uses config.BOOTSTRAPPING_INTERPOLATION_METHOD, the method the stored
+    curves were built with.
+
+    Entries are keyed by curve type and date and dropped, like the response
+    cache, when a refresh completes, so a hit skips loading the curve too.
+
+    Args:
+        curve_type: Type of curve (treasury or corporate)
+        curve_date: Curve date
+        load_points: Returns the curve's (maturities, yields) on a miss
+
+    Returns:
+        Tuple of (fitted scipy interpolator for array evaluation, scalar
+        evaluator of the same interpolator, min maturity, max maturity)
+    """
+    def fit():
+        maturities, yields = load_points()
+        maturities_arr = np.asarray(maturities, dtype=np.float64)
+        interpolator = build_interpolator(
+            maturities_arr, np.asarray(yields, dtype=np.float64),
+            config.BOOTSTRAPPING_INTERPOLATION_METHOD
+        )
+
+        # Maturities are ascending (the interpolators require it), so the ends are the bounds
+        return (
+            interpolator, ScalarSplineEvaluator(interpolator),
+            float(maturities_arr[0]), float(maturities_arr[-1])
+        )
+
+    return _splines.get_or_compute((curve_type, curve_date), fit, config.RESPONSE_CACHE_TTL)
+
 
 # Response models
 class CurveResponse(BaseModel):
@@ -23,8 +78,9 @@ class CurveResponse(BaseModel):
     yields: List[float] = Field(..., description="Yields in percentage")
     discount_factors: Optional[List[float]] = Field(None, description="Discount factors")
     forward_rates: Optional[List[float]] = Field(None, description="Forward rates")
-    interpolated_maturities: Optional[List[float]] = Field(None, description="Interpolated maturities (daily)")
-    interpolated_yields: Optional[List[float]] = Field(None, description="Interpolated yields (daily)")
+    original_maturities: Optional[List[float]] = Field(None, description="Maturities of the sparse FRED input points")
+    original_yields: Optional[List[float]] = Field(None, description="Yields of the sparse FRED input points")
+    ratings: Optional[List[str]] = Field(None, description="Ratings making up a corporate curve")
 
 
 class SpreadCurveResponse(BaseModel):
@@ -55,8 +111,8 @@ class AvailableDatesResponse(BaseModel):
 
 
 # Treasury endpoints
-@router.get("/treasury/latest", response_model=CurveResponse, tags=["Treasury"])
-async def get_latest_treasury_curve(
+@router.get("/treasury/latest", response_model=None, responses={200: {"model": CurveResponse}}, tags=["Treasury"])
+def get_latest_treasury_curve(
     max_points: int = Query(300, description="Max interpolated points to return (for performance)"),
     db: Session = Depends(get_db)
 ):
@@ -66,22 +122,16 @@ async def get_latest_treasury_curve(
     Returns the most recent bootstrapped Treasury curve with interpolated daily granularity.
     Use max_points parameter to control response size (default: 300 points is smooth enough for visualization).
     """
-    builder = TreasuryCurveBuilder(db)
-    curve = builder.get_latest_curve()
+    curve = TreasuryCurveBuilder(db).get_latest_curve(max_points=max_points)
 
     if not curve:
         raise HTTPException(status_code=404, detail="No Treasury curve data available")
 
-    # Apply downsampling if needed
-    if max_points and curve:
-        curve_date = curve.get('curve_date')
-        curve = builder.get_curve(datetime.fromisoformat(curve_date).date(), max_points=max_points)
-
-    return curve
+    return ORJSONResponse(curve)
 
 
-@router.get("/treasury/{curve_date}", response_model=CurveResponse, tags=["Treasury"])
-async def get_treasury_curve(
+@router.get("/treasury/{curve_date}", response_model=None, responses={200: {"model": CurveResponse}}, tags=["Treasury"])
+def get_treasury_curve(
     curve_date: date = Path(..., description="Date in YYYY-MM-DD format"),
     max_points: int = Query(300, description="Max interpolated points to return"),
     db: Session = Depends(get_db)
@@ -92,8 +142,7 @@ async def get_treasury_curve(
     Returns the bootstrapped Treasury curve for the requested date.
     Use max_points parameter to control response size (default: 300 points).
     """
-    builder = TreasuryCurveBuilder(db)
-    curve = builder.get_curve(curve_date, max_points=max_points)
+    curve = TreasuryCurveBuilder(db).get_curve(curve_date, max_points=max_points)
 
     if not curve:
         raise HTTPException(
@@ -101,11 +150,16 @@ async def get_treasury_curve(
             detail=f"No Treasury curve data available for {curve_date}"
         )
 
-    return curve
+    return ORJSONResponse(curve)
 
 
-@router.get("/treasury/range/{start_date}/{end_date}", response_model=List[CurveResponse], tags=["Treasury"])
-async def get_treasury_curve_range(
+@router.get(
+    "/treasury/range/{start_date}/{end_date}",
+    response_model=None,
+    responses={200: {"model": List[CurveResponse]}},
+    tags=["Treasury"]
+)
+def get_treasury_curve_range(
     start_date: date = Path(..., description="Start date in YYYY-MM-DD format"),
     end_date: date = Path(..., description="End date in YYYY-MM-DD format"),
     db: Session = Depends(get_db)
@@ -114,25 +168,84 @@ async def get_treasury_curve_range(
     Get US Treasury yield curves for a date range.
 
     Returns all available Treasury curves between start_date and end_date.
+    The response is streamed one curve at a time, so long ranges start
+    arriving immediately and are never held in memory as a whole.
     """
-    curves = db.query(BootstrappedCurve).filter(
+    range_filter = (
         BootstrappedCurve.curve_type == 'treasury',
         BootstrappedCurve.curve_date >= start_date,
-        BootstrappedCurve.curve_date <= end_date
-    ).order_by(BootstrappedCurve.curve_date).all()
+        BootstrappedCurve.curve_date <= end_date,
+    )
 
-    if not curves:
+    if db.query(BootstrappedCurve.id).filter(*range_filter).first() is None:
         raise HTTPException(
             status_code=404,
             detail=f"No Treasury curves found between {start_date} and {end_date}"
         )
 
+    def stream_curves():
+        # The request session may already be closed while the body is
+        # streamed, so the generator reads through its own session. All
+        # curves come from one query, fetched in batches.
+        stream_db = SessionLocal()
+        try:
+            builder = TreasuryCurveBuilder(stream_db)
+            result = stream_db.execute(
+                select(BootstrappedCurve)
+                .where(*range_filter)
+                .order_by(BootstrappedCurve.curve_date)
+                .execution_options(yield_per=config.RANGE_FETCH_BATCH_SIZE)
+            )
+            yield b'['
+            first = True
+            for batch in result.scalars().partitions():
+                for curve in builder.build_curves_bulk(batch):
+                    if not first:
+                        yield b','
+                    first = False
+                    yield orjson.dumps(curve)
+            yield b']'
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(stream_curves(), media_type="application/json")
+
+
+@router.get("/treasury/range/{start_date}/{end_date}/tenors", tags=["Treasury"])
+def get_treasury_tenor_range(
+    start_date: date = Path(..., description="Start date in YYYY-MM-DD format"),
+    end_date: date = Path(..., description="End date in YYYY-MM-DD format"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get standard-tenor Treasury yields for a date range as a dense matrix.
+
+    Returns one row of yields per date, with one column per standard tenor
+    (1M to 30Y). Much smaller than the full curve range when only the
+    quoted tenors are needed. Missing observations are null.
+    """
     builder = TreasuryCurveBuilder(db)
-    return [builder.get_curve(curve.curve_date) for curve in curves]
+    dates, yields = builder.get_tenor_matrix(start_date, end_date)
+
+    if not dates:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No Treasury tenor data found between {start_date} and {end_date}"
+        )
+
+    return {
+        'tenors': list(config.TREASURY_TENORS),
+        'maturities': config.TREASURY_MATURITIES_ARR.tolist(),
+        'dates': [d.isoformat() for d in dates],
+        'yields': [
+            [None if np.isnan(v) else round(float(v), 2) for v in row]
+            for row in yields
+        ],
+    }
 
 
 @router.get("/treasury/{curve_date}/yield/{maturity}", tags=["Treasury"])
-async def get_treasury_yield_at_maturity(
+def get_treasury_yield_at_maturity(
     curve_date: date = Path(..., description="Date in YYYY-MM-DD format"),
     maturity: float = Path(..., description="Maturity in years (e.g., 10.0055 for 10Y and 2 days)"),
     db: Session = Depends(get_db)
@@ -147,54 +260,110 @@ async def get_treasury_yield_at_maturity(
     Returns:
         Interpolated yield at the specified maturity
     """
-    from scipy.interpolate import interp1d
-    import numpy as np
-
-    builder = TreasuryCurveBuilder(db)
-    curve = builder.get_curve(curve_date)
+    _, evaluate, min_mat, max_mat = _get_curve_spline(
+        'treasury', curve_date, lambda: _get_treasury_curve_points(db, curve_date)
+    )
 
-    if not curve:
+    # Check if maturity is within bounds
+    if maturity < min_mat or maturity > max_mat:
         raise HTTPException(
-            status_code=404,
-            detail=f"No Treasury curve data available for {curve_date}"
+            status_code=400,
+            detail=f"Maturity {maturity} is outside available range [{min_mat}, {max_mat}]"
         )
 
-    # Use interpolated curve if available
-    maturities = curve.get('maturities', [])
-    yields = curve.get('yields', [])
+    # Interpolate to find yield at requested maturity
+    interpolated_yield = evaluate(maturity)
 
-    if not maturities or not yields:
+    return {
+        'curve_date': curve_date.isoformat(),
+        'maturity': maturity,
+        'yield': round(interpolated_yield, 6),
+        'curve_type': 'treasury',
+        'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD
+    }
+
+
+@router.post("/treasury/{curve_date}/yield/batch", tags=["Treasury"])
+def get_treasury_yields_at_maturities(
+    curve_date: date = Path(..., description="Date in YYYY-MM-DD format"),
+    maturities: List[float] = Body(..., description="Maturities in years, e.g. a coupon schedule"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get interpolated Treasury yields for many maturities in one request.
+
+    Evaluates the same interpolator as the single-maturity endpoint for every
+    requested maturity at once, so valuing a cash-flow schedule takes one
+    round-trip instead of one per date.
+
+    Returns:
+        Interpolated yields in the order the maturities were given
+    """
+    if not maturities:
+        raise HTTPException(status_code=400, detail="At least one maturity is required")
+    if len(maturities) > config.YIELD_BATCH_MAX_MATURITIES:
         raise HTTPException(
-            status_code=404,
-            detail="No yield curve data available"
+            status_code=400,
+            detail=f"At most {config.YIELD_BATCH_MAX_MATURITIES} maturities per request"
         )
 
-    # Check if maturity is within bounds
-    min_mat = min(maturities)
-    max_mat = max(maturities)
+    requested = np.asarray(maturities, dtype=np.float64)
+    interpolator, _, min_mat, max_mat = _get_curve_spline(
+        'treasury', curve_date, lambda: _get_treasury_curve_points(db, curve_date)
+    )
 
-    if maturity < min_mat or maturity > max_mat:
+    out_of_range = np.flatnonzero((requested < min_mat) | (requested > max_mat))
+    if out_of_range.size:
         raise HTTPException(
             status_code=400,
-            detail=f"Maturity {maturity} is outside available range [{min_mat}, {max_mat}]"
+            detail=(
+                f"Maturities at indices {out_of_range.tolist()} are outside "
+                f"available range [{min_mat}, {max_mat}]"
+            )
         )
 
-    # Interpolate to find yield at requested maturity
-    interpolator = interp1d(maturities, yields, kind='cubic', fill_value='extrapolate')
-    interpolated_yield = float(interpolator(maturity))
+    interpolated_yields = np.round(interpolator(requested), 6)
 
     return {
         'curve_date': curve_date.isoformat(),
-        'maturity': maturity,
-        'yield': round(interpolated_yield, 6),
+        'maturities': maturities,
+        'yields': interpolated_yields.tolist(),
         'curve_type': 'treasury',
-        'interpolation_method': 'cubic'
+        'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD
     }
 
 
+def _get_treasury_curve_points(db: Session, curve_date: date) -> Tuple[List[float], List[float]]:
+    """
+    Load the dense Treasury curve used for yield-at-maturity interpolation.
+
+    Raises:
+        HTTPException: 404 if no curve is stored for the date
+    """
+    curve = TreasuryCurveBuilder(db).get_curve(curve_date)
+
+    if not curve:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No Treasury curve data available for {curve_date}"
+        )
+
+    # Use interpolated curve if available
+    maturities = curve.get('maturities', [])
+    yields = curve.get('yields', [])
+
+    if not maturities or not yields:
+        raise HTTPException(
+            status_code=404,
+            detail="No yield curve data available"
+        )
+
+    return maturities, yields
+
+
 # Corporate endpoints
-@router.get("/corporate/latest", response_model=CurveResponse, tags=["Corporate"])
-async def get_latest_corporate_curve(
+@router.get("/corporate/latest", response_model=None, responses={200: {"model": CurveResponse}}, tags=["Corporate"])
+def get_latest_corporate_curve(
     max_points: int = Query(300, description="Max interpolated points to return"),
     db: Session = Depends(get_db)
 ):
@@ -203,22 +372,16 @@ async def get_latest_corporate_curve(
 
     Returns the most recent bootstrapped corporate bond curve.
     """
-    builder = CorporateCurveBuilder(db)
-    curve = builder.get_latest_curve()
+    curve = CorporateCurveBuilder(db).get_latest_curve(max_points=max_points)
 
     if not curve:
         raise HTTPException(status_code=404, detail="No Corporate curve data available")
 
-    # Apply downsampling if needed
-    if max_points and curve:
-        curve_date = curve.get('curve_date')
-        curve = builder.get_curve(datetime.fromisoformat(curve_date).date(), max_points=max_points)
-
-    return curve
+    return ORJSONResponse(curve)
 
 
-@router.get("/corporate/{curve_date}", response_model=CurveResponse, tags=["Corporate"])
-async def get_corporate_curve(
+@router.get("/corporate/{curve_date}", response_model=None, responses={200: {"model": CurveResponse}}, tags=["Corporate"])
+def get_corporate_curve(
     curve_date: date = Path(..., description="Date in YYYY-MM-DD format"),
     max_points: int = Query(300, description="Max interpolated points to return"),
     db: Session = Depends(get_db)
@@ -228,8 +391,7 @@ async def get_corporate_curve(
 
     Returns the bootstrapped corporate curve for the requested date.
     """
-    builder = CorporateCurveBuilder(db)
-    curve = builder.get_curve(curve_date, max_points=max_points)
+    curve = CorporateCurveBuilder(db).get_curve(curve_date, max_points=max_points)
 
     if not curve:
         raise HTTPException(
@@ -237,11 +399,11 @@ async def get_corporate_curve(
             detail=f"No Corporate curve data available for {curve_date}"
         )
 
-    return curve
+    return ORJSONResponse(curve)
 
 
 @router.get("/corporate/{curve_date}/yield/{maturity}", tags=["Corporate"])
-async def get_corporate_yield_at_maturity(
+def get_corporate_yield_at_maturity(
     curve_date: date = Path(..., description="Date in YYYY-MM-DD format"),
     maturity: float = Path(..., description="Maturity in years (e.g., 10.0055 for 10Y and 2 days)"),
     db: Session = Depends(get_db)
@@ -255,11 +417,37 @@ async def get_corporate_yield_at_maturity(
     Returns:
         Interpolated yield at the specified maturity
     """
-    from scipy.interpolate import interp1d
-    import numpy as np
+    _, evaluate, min_mat, max_mat = _get_curve_spline(
+        'corporate', curve_date, lambda: _get_corporate_curve_points(db, curve_date)
+    )
 
-    builder = CorporateCurveBuilder(db)
-    curve = builder.get_curve(curve_date)
+    # Check if maturity is within bounds
+    if maturity < min_mat or maturity > max_mat:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Maturity {maturity} is outside available range [{min_mat}, {max_mat}]"
+        )
+
+    # Interpolate to find yield at requested maturity
+    interpolated_yield = evaluate(maturity)
+
+    return {
+        'curve_date': curve_date.isoformat(),
+        'maturity': maturity,
+        'yield': round(interpolated_yield, 6),
+        'curve_type': 'corporate',
+        'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD
+    }
+
+
+def _get_corporate_curve_points(db: Session, curve_date: date) -> Tuple[List[float], List[float]]:
+    """
+    Load the dense Corporate curve used for yield-at-maturity interpolation.
+
+    Raises:
+        HTTPException: 404 if no curve is stored for the date
+    """
+    curve = CorporateCurveBuilder(db).get_curve(curve_date)
 
     if not curve:
         raise HTTPException(
@@ -277,31 +465,31 @@ async def get_corporate_yield_at_maturity(
             detail="No yield curve data available"
         )
 
-    # Check if maturity is within bounds
-    min_mat = min(maturities)
-    max_mat = max(maturities)
+    return maturities, yields
 
-    if maturity < min_mat or maturity > max_mat:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Maturity {maturity} is outside available range [{min_mat}, {max_mat}]"
-        )
 
-    # Interpolate to find yield at requested maturity
-    interpolator = interp1d(maturities, yields, kind='cubic', fill_value='extrapolate')
-    interpolated_yield = float(interpolator(maturity))
+@router.get("/corporate/spread/all/latest", tags=["Corporate"])
+def get_latest_spread_curves_all(db: Session = Depends(get_db)):
+    """
+    Get the latest spread curves for all credit ratings.
+
+    Returns spreads over treasuries for every rating on the most recent
+    date in one response, instead of one request per rating.
+    """
+    latest_date = db.query(func.max(CorporateSpreadCurve.curve_date)).scalar()
 
+    if latest_date is None:
+        raise HTTPException(status_code=404, detail="No spread curve data available")
+
+    builder = CorporateCurveBuilder(db)
     return {
-        'curve_date': curve_date.isoformat(),
-        'maturity': maturity,
-        'yield': round(interpolated_yield, 6),
-        'curve_type': 'corporate',
-        'interpolation_method': 'cubic'
+        'curve_date': latest_date.isoformat(),
+        'spreads': builder.get_all_spread_curves(latest_date),
     }
 
 
-@router.get("/corporate/spread/{rating}/latest", response_model=SpreadCurveResponse, tags=["Corporate"])
-async def get_latest_spread_curve(
+@router.get("/corporate/spread/{rating}/latest", response_model=None, responses={200: {"model": SpreadCurveResponse}}, tags=["Corporate"])
+def get_latest_spread_curve(
     rating: str = Path(..., description="Credit rating (e.g., AAA, BAA)"),
     db: Session = Depends(get_db)
 ):
@@ -321,11 +509,11 @@ async def get_latest_spread_curve(
         )
 
     builder = CorporateCurveBuilder(db)
-    return builder.get_spread_curve(rating, spread_curve.curve_date)
+    return ORJSONResponse(builder.get_spread_curve(rating, spread_curve.curve_date))
 
 
-@router.get("/corporate/spread/{rating}/{curve_date}", response_model=SpreadCurveResponse, tags=["Corporate"])
-async def get_spread_curve(
+@router.get("/corporate/spread/{rating}/{curve_date}", response_model=None, responses={200: {"model": SpreadCurveResponse}}, tags=["Corporate"])
+def get_spread_curve(
     rating: str = Path(..., description="Credit rating"),
     curve_date: date = Path(..., description="Date in YYYY-MM-DD format"),
     db: Session = Depends(get_db)
@@ -335,8 +523,11 @@ async def get_spread_curve(
 
     Returns spreads over treasuries for the specified rating and date.
     """
-    builder = CorporateCurveBuilder(db)
-    spread_curve = builder.get_spread_curve(rating, curve_date)
+    spread_curve = _responses.get_or_compute(
+        ('spread', rating, curve_date),
+        lambda: CorporateCurveBuilder(db).get_spread_curve(rating, curve_date),
+        config.RESPONSE_CACHE_TTL
+    )
 
     if not spread_curve:
         raise HTTPException(
@@ -344,55 +535,96 @@ async def get_spread_curve(
             detail=f"No spread curve data available for {rating} on {curve_date}"
         )
 
-    return spread_curve
+    return ORJSONResponse(spread_curve)
 
 
 # Raw data endpoints
-@router.get("/raw/treasury/{series_name}", response_model=List[RawDataResponse], tags=["Raw Data"])
-async def get_raw_treasury_data(
-    series_name: str = Path(..., description="Series name (e.g., 1M, 3M, 10Y)"),
-    start_date: Optional[date] = Query(None, description="Start date"),
-    end_date: Optional[date] = Query(None, description="End date"),
-    limit: int = Query(1000, le=10000, description="Maximum number of records"),
-    db: Session = Depends(get_db)
-):
+_RAW_COLUMNS = (
+    RawYieldData.series_id,
+    RawYieldData.series_name,
+    RawYieldData.data_type,
+    RawYieldData.date,
+    RawYieldData.value,
+)
+
+
+def _raw_data_response(
+    db: Session,
+    data_type: str,
+    series_name: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    limit: int
+) -> StreamingResponse:
     """
-    Get raw Treasury data for a specific series.
+    Stream raw observations as a JSON array, one batch of rows at a time.
 
-    Returns raw yield data from FRED for the specified Treasury series.
+    Rows are selected as plain columns (no ORM objects) and encoded by
+    orjson, which writes dates as YYYY-MM-DD itself. Only one batch of
+    config.RAW_FETCH_BATCH_SIZE rows is held in memory at once.
     """
-    query = db.query(RawYieldData).filter(
-        RawYieldData.data_type == 'treasury',
-        RawYieldData.series_name == series_name
-    )
+    conditions = [
+        RawYieldData.data_type == data_type,
+        RawYieldData.series_name == series_name,
+    ]
 
     if start_date:
-        query = query.filter(RawYieldData.date >= start_date)
+        conditions.append(RawYieldData.date >= start_date)
     if end_date:
-        query = query.filter(RawYieldData.date <= end_date)
-
-    data = query.order_by(RawYieldData.date.desc()).limit(limit).all()
+        conditions.append(RawYieldData.date <= end_date)
 
-    if not data:
+    if db.execute(select(RawYieldData.id).where(*conditions).limit(1)).first() is None:
         raise HTTPException(
             status_code=404,
             detail=f"No raw data available for {series_name}"
         )
 
-    return [
-        {
-            'series_id': d.series_id,
-            'series_name': d.series_name,
-            'data_type': d.data_type,
-            'date': d.date.isoformat(),
-            'value': d.value,
-        }
-        for d in data
-    ]
+    stmt = (
+        select(*_RAW_COLUMNS)
+        .where(*conditions)
+        .order_by(RawYieldData.date.desc())
+        .limit(limit)
+        .execution_options(yield_per=config.RAW_FETCH_BATCH_SIZE)
+    )
+
+    def stream_rows():
+        # Same reasoning as the range endpoint: read through a session
+        # owned by the generator
+        stream_db = SessionLocal()
+        try:
+            yield b'['
+            first = True
+            for batch in stream_db.execute(stmt).mappings().partitions():
+                if not first:
+                    yield b','
+                first = False
+                # Encode the batch as one array and drop its brackets
+                yield orjson.dumps([dict(row) for row in batch])[1:-1]
+            yield b']'
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(stream_rows(), media_type="application/json")
+
+
+@router.get("/raw/treasury/{series_name}", response_model=List[RawDataResponse], tags=["Raw Data"])
+def get_raw_treasury_data(
+    series_name: str = Path(..., description="Series name (e.g., 1M, 3M, 10Y)"),
+    start_date: Optional[date] = Query(None, description="Start date"),
+    end_date: Optional[date] = Query(None, description="End date"),
+    limit: int = Query(1000, le=10000, description="Maximum number of records"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get raw Treasury data for a specific series.
+
+    Returns raw yield data from FRED for the specified Treasury series.
+    """
+    return _raw_data_response(db, 'treasury', series_name, start_date, end_date, limit)
 
 
 @router.get("/raw/corporate/{series_name}", response_model=List[RawDataResponse], tags=["Raw Data"])
-async def get_raw_corporate_data(
+def get_raw_corporate_data(
     series_name: str = Path(..., description="Series name (e.g., AAA, BAA)"),
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
@@ -404,58 +636,47 @@ async def get_raw_corporate_data(
 
     Returns raw yield data from FRED for the specified corporate bond series.
     """
-    query = db.query(RawYieldData).filter(
-        RawYieldData.data_type == 'corporate',
-        RawYieldData.series_name == series_name
-    )
-
-    if start_date:
-        query = query.filter(RawYieldData.date >= start_date)
-    if end_date:
-        query = query.filter(RawYieldData.date <= end_date)
-
-    data = query.order_by(RawYieldData.date.desc()).limit(limit).all()
-
-    if not data:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No raw data available for {series_name}"
-        )
-
-    return [
-        {
-            'series_id': d.series_id,
-            'series_name': d.series_name,
-            'data_type': d.data_type,
-            'date': d.date.isoformat(),
-            'value': d.value,
-        }
-        for d in data
-    ]
+    return _raw_data_response(db, 'corporate', series_name, start_date, end_date, limit)
 
 
 # Metadata endpoints
 @router.get("/dates/available", response_model=List[AvailableDatesResponse], tags=["Metadata"])
-async def get_available_dates(db: Session = Depends(get_db)):
+def get_available_dates(db: Session = Depends(get_db)):
     """
     Get information about available curve dates.
 
     Returns the date range and count for both Treasury and Corporate curves.
     """
-    results = []
-
-    for curve_type in ['treasury', 'corporate']:
-        curves = db.query(BootstrappedCurve).filter_by(
-            curve_type=curve_type
-        ).order_by(BootstrappedCurve.curve_date).all()
-
-        if curves:
-            results.append({
-                'curve_type': curve_type,
-                'start_date': curves[0].curve_date.isoformat(),
-                'end_date': curves[-1].curve_date.isoformat(),
-                'total_dates': len(curves),
-            })
+    def load():
+        # The database aggregates under the (curve_type, curve_date) unique
+        # index instead of every curve row being loaded
+        rows = db.execute(
+            select(
+                BootstrappedCurve.curve_type,
+                func.min(BootstrappedCurve.curve_date),
+                func.max(BootstrappedCurve.curve_date),
+                func.count(),
+            ).group_by(BootstrappedCurve.curve_type)
+        ).all()
+        ranges = {row[0]: row for row in rows}
+
+        results = []
+
+        for curve_type in ['treasury', 'corporate']:
+            if curve_type in ranges:
+                _, start, end, total = ranges[curve_type]
+                results.append({
+                    'curve_type': curve_type,
+                    'start_date': start.isoformat(),
+                    'end_date': end.isoformat(),
+                    'total_dates': total,
+                })
+
+        return results or None
+
+    results = _responses.get_or_compute(
+        ('dates', 'available'), load, config.RESPONSE_CACHE_TTL
+    )
 
     if not results:
         raise HTTPException(status_code=404, detail="No curve data available")
@@ -464,31 +685,36 @@ async def get_available_dates(db: Session = Depends(get_db)):
 
 
 @router.get("/health", tags=["Metadata"])
-async def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_db)):
     """
     Health check endpoint.
 
     Returns API status and database connectivity.
     """
-    try:
-        # Check database connection
-        db.execute("SELECT 1")
-
-        # Get latest data dates
-        latest_treasury = db.query(BootstrappedCurve).filter_by(
-            curve_type='treasury'
-        ).order_by(BootstrappedCurve.curve_date.desc()).first()
-
-        latest_corporate = db.query(BootstrappedCurve).filter_by(
-            curve_type='corporate'
-        ).order_by(BootstrappedCurve.curve_date.desc()).first()
+    def load():
+        # One grouped query both proves connectivity and finds the latest dates
+        latest = dict(db.execute(
+            select(BootstrappedCurve.curve_type, func.max(BootstrappedCurve.curve_date))
+            .group_by(BootstrappedCurve.curve_type)
+        ).all())
+
+        # Written by the scheduler process after each completed refresh
+        try:
+            last_refresh = json.loads(config.REFRESH_MARKER_PATH.read_text())
+        except (OSError, ValueError):
+            last_refresh = None
 
         return {
             'status': 'healthy',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
             'database': 'connected',
-            'latest_treasury_date': latest_treasury.curve_date.isoformat() if latest_treasury else None,
-            'latest_corporate_date': latest_corporate.curve_date.isoformat() if latest_corporate else None,
+            'latest_treasury_date': latest['treasury'].isoformat() if latest.get('treasury') else None,
+            'latest_corporate_date': latest['corporate'].isoformat() if latest.get('corporate') else None,
+            'last_refresh': last_refresh,
         }
+
+    try:
+        # Cached briefly so frequent liveness probes do not each hit the database
+        return _responses.get_or_compute(('health',), load, config.HEALTH_CACHE_TTL)
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
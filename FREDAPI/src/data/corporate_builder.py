@@ -1,7 +1,7 @@
 """
 Corporate Bond Indices Curve Builder.
 """
-from datetime import datetime, date
+from datetime import date
 from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
@@ -9,11 +9,32 @@ from sqlalchemy.orm import Session
 import logging
 
 import config
-from src.models.database import RawYieldData, BootstrappedCurve, CorporateSpreadCurve
-from src.utils.bootstrapping import YieldCurveBootstrapper, validate_curve_data
+from src.models.database import (
+    RawYieldData,
+    BootstrappedCurve,
+    CorporateSpreadCurve,
+    upsert_bootstrapped_curves,
+    upsert_raw_yield_data,
+    upsert_spread_curves,
+)
+from src.utils.bootstrapping import (
+    YieldCurveBootstrapper,
+    downsample_curve,
+    precompute_downsampled_curves,
+    validate_curve_data,
+)
+from src.utils.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Curve dictionaries read back from the database, keyed by
+# (curve_date or 'latest', max_points). Cleared when curves are stored here
+# and, through the refresh marker, when another process refreshes.
+_curve_cache = ResponseCache(config.CURVE_CACHE_SIZE)
+
+# Corporate rating -> FRED series ID, built once so store_raw_data maps with a hash lookup
+_SERIES_MAP = pd.Series(dict(config.CORPORATE_SERIES))
+
 
 class CorporateCurveBuilder:
     """Build and manage corporate bond yield curves."""
@@ -30,55 +51,45 @@ class CorporateCurveBuilder:
             interpolation_method=config.BOOTSTRAPPING_INTERPOLATION_METHOD
         )
 
-    def store_raw_data(self, df: pd.DataFrame) -> int:
+    def store_raw_data(self, df: pd.DataFrame, commit: bool = True) -> int:
         """
         Store raw corporate bond data in database.
 
         Args:
             df: DataFrame with dates as index and ratings as columns
+            commit: Commit the records; if False they are only flushed, for
+                callers that commit together with the curves they build
 
         Returns:
             Number of records stored
         """
         logger.info(f"Storing raw Corporate data: {len(df)} dates, {len(df.columns)} series")
 
-        records_stored = 0
-
-        for date_idx in df.index:
-            curve_date = date_idx.date() if isinstance(date_idx, pd.Timestamp) else date_idx
+        # Convert the dates once per frame row, before melting multiplies them
+        df = df.set_axis(pd.DatetimeIndex(df.index).date, axis=0)
 
-            for rating in df.columns:
-                value = df.loc[date_idx, rating]
-                series_id = config.CORPORATE_SERIES.get(rating)
-
-                if series_id is None:
-                    continue
+        # Only configured series are stored; resolve their IDs once per column
+        df = df.loc[:, df.columns.isin(_SERIES_MAP.index)]
 
-                # Check if record exists
-                existing = self.db.query(RawYieldData).filter_by(
-                    series_id=series_id,
-                    date=curve_date
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    if pd.notna(value):
-                        existing.value = float(value)
-                        existing.updated_at = datetime.utcnow()
-                else:
-                    # Create new record
-                    record = RawYieldData(
-                        series_id=series_id,
-                        series_name=rating,
-                        data_type='corporate',
-                        date=curve_date,
-                        value=float(value) if pd.notna(value) else None
-                    )
-                    self.db.add(record)
+        # One row per (date, series) in a single vectorized reshape. melt()
+        # stacks whole columns, so each column's ID is simply repeated
+        long = df.reset_index(names='date').melt(
+            id_vars='date', var_name='series_name', value_name='value'
+        )
+        long['series_id'] = np.repeat(_SERIES_MAP[df.columns].to_numpy(), len(df))
+        long['data_type'] = 'corporate'
+        # Round in float64 so float32 input does not reintroduce artifacts
+        values = long['value'].astype(np.float64).round(config.RAW_VALUE_DECIMALS)
+        long['value'] = values.astype(object).where(values.notna(), None)
 
-                records_stored += 1
+        records = long[['series_id', 'series_name', 'data_type', 'date', 'value']].to_dict('records')
 
-        self.db.commit()
+        upsert_raw_yield_data(self.db, records)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        records_stored = len(records)
         logger.info(f"Stored {records_stored} Corporate data records")
 
         return records_stored
@@ -100,19 +111,38 @@ class CorporateCurveBuilder:
         ).all()
 
         if not raw_data:
-            logger.debug(f"No Corporate data found for {curve_date}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No Corporate data found for %s", curve_date)
             return None
 
-        # Extract maturities and yields
+        values = {
+            record.series_name: record.value
+            for record in raw_data
+            if record.value is not None
+        }
+
+        return self.build_curve_from_values(curve_date, values)
+
+    def build_curve_from_values(self, curve_date: date, values: Dict[str, float]) -> Optional[Dict]:
+        """
+        Build bootstrapped corporate bond curve from already-loaded yields.
+
+        Args:
+            curve_date: Date of the curve
+            values: Yield per series name, without missing observations
+
+        Returns:
+            Dictionary containing curve data or None if insufficient data
+        """
+        # Extract maturities and yields in config order
         maturities = []
         yields = []
         ratings = []
 
-        for record in raw_data:
-            rating = record.series_name
-            if rating in config.CORPORATE_MATURITIES and record.value is not None:
-                maturities.append(config.CORPORATE_MATURITIES[rating])
-                yields.append(record.value)
+        for rating, _, maturity in config.CORPORATE_ITEMS:
+            if rating in values:
+                maturities.append(maturity)
+                yields.append(values[rating])
                 ratings.append(rating)
 
         # Validate data
@@ -123,7 +153,8 @@ class CorporateCurveBuilder:
         )
 
         if not is_valid:
-            logger.debug(f"Skipping corporate curve for {curve_date}: {error_msg}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping corporate curve for %s: %s", curve_date, error_msg)
             return None
 
         try:
@@ -146,13 +177,14 @@ class CorporateCurveBuilder:
                 'maturities': maturities,
                 'yields': yields,
                 'ratings': ratings,
-                'interpolated_maturities': interpolated_maturities.tolist(),
-                'interpolated_yields': interpolated_yields.tolist(),
-                'discount_factors': discount_factors.tolist(),
+                'interpolated_maturities': interpolated_maturities,
+                'interpolated_yields': interpolated_yields,
+                'discount_factors': discount_factors,
                 'forward_rates': forward_rates.tolist(),
             }
 
-            logger.debug(f"Built Corporate curve for {curve_date} with {len(maturities)} points")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Built Corporate curve for %s with %d points", curve_date, len(maturities))
 
             return curve_data
 
@@ -177,7 +209,8 @@ class CorporateCurveBuilder:
         ).first()
 
         if not treasury_curve:
-            logger.debug(f"No Treasury curve found for {curve_date}, skipping spreads")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No Treasury curve found for %s, skipping spreads", curve_date)
             return []
 
         # Get corporate data
@@ -187,65 +220,88 @@ class CorporateCurveBuilder:
         ).all()
 
         if not corporate_data:
-            logger.debug(f"No Corporate data found for {curve_date}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No Corporate data found for %s", curve_date)
             return []
 
-        # Group by rating/category
-        rating_groups = {}
-        for record in corporate_data:
-            rating = record.series_name
-            if rating not in rating_groups:
-                rating_groups[rating] = []
-            rating_groups[rating].append(record)
+        values = {
+            record.series_name: record.value
+            for record in corporate_data
+            if record.value is not None
+        }
 
-        spread_curves = []
+        return self.build_spread_curves_from_values(
+            curve_date, treasury_curve.maturities, treasury_curve.yields, values
+        )
 
-        # Build spread curve for each rating
-        for rating, records in rating_groups.items():
-            try:
-                maturities = []
-                corporate_yields = []
+    def build_spread_curves_from_values(
+        self,
+        curve_date: date,
+        treasury_maturities: List[float],
+        treasury_yields: List[float],
+        values: Dict[str, float]
+    ) -> List[Dict]:
+        """
+        Build corporate spread curves from an already-loaded Treasury curve and yields.
 
-                for record in records:
-                    if rating in config.CORPORATE_MATURITIES and record.value is not None:
-                        maturity = config.CORPORATE_MATURITIES[rating]
-                        maturities.append(maturity)
-                        corporate_yields.append(record.value)
+        Args:
+            curve_date: Date of the curves
+            treasury_maturities: Original maturities of the Treasury curve
+            treasury_yields: Original yields of the Treasury curve
+            values: Corporate yield per series name, without missing observations
 
-                if len(maturities) < 1:
-                    continue
+        Returns:
+            List of spread curve dictionaries
+        """
+        # Collect every rating's points so the Treasury curve is evaluated once
+        rating_slices = []
+        all_maturities = []
+        all_corporate_yields = []
 
-                # Interpolate treasury yields at corporate maturities
-                treasury_maturities = treasury_curve.maturities
-                treasury_yields = treasury_curve.yields
+        for rating, value in values.items():
+            if rating not in config.CORPORATE_MATURITIES:
+                continue
 
-                # Create interpolator for treasury curve
-                treasury_interp_mat, treasury_interp_yields = self.bootstrapper.interpolate_curve(
-                    treasury_maturities,
-                    treasury_yields,
-                    target_maturities=maturities
-                )
+            start = len(all_maturities)
+            all_maturities.append(config.CORPORATE_MATURITIES[rating])
+            all_corporate_yields.append(value)
+            rating_slices.append((rating, slice(start, len(all_maturities))))
 
-                # Calculate spreads
-                spreads = self.bootstrapper.calculate_spreads(
-                    corporate_yields,
-                    treasury_interp_yields
-                )
+        if not rating_slices:
+            return []
+
+        try:
+            # Interpolate treasury yields at all corporate maturities in one pass
+            treasury_interp_mat, treasury_interp_yields = self.bootstrapper.interpolate_curve(
+                treasury_maturities,
+                treasury_yields,
+                target_maturities=all_maturities
+            )
 
-                spread_curve = {
-                    'rating': rating,
-                    'curve_date': curve_date,
-                    'maturities': maturities,
-                    'spreads': spreads.tolist(),
-                    'corporate_yields': corporate_yields,
-                    'treasury_yields': treasury_interp_yields.tolist(),
-                }
+            # Calculate spreads for every rating at once
+            all_spreads = self.bootstrapper.calculate_spreads(
+                all_corporate_yields,
+                treasury_interp_yields
+            )
+        except Exception as e:
+            logger.error(f"Failed to build spread curves on {curve_date}: {str(e)}")
+            return []
 
-                spread_curves.append(spread_curve)
-                logger.debug(f"Built spread curve for {rating} on {curve_date}")
+        spread_curves = []
 
-            except Exception as e:
-                logger.error(f"Failed to build spread curve for {rating} on {curve_date}: {str(e)}")
+        for rating, points in rating_slices:
+            spread_curve = {
+                'rating': rating,
+                'curve_date': curve_date,
+                'maturities': all_maturities[points],
+                'spreads': all_spreads[points].tolist(),
+                'corporate_yields': all_corporate_yields[points],
+                'treasury_yields': treasury_interp_yields[points].tolist(),
+            }
+
+            spread_curves.append(spread_curve)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Built spread curve for %s on %s", rating, curve_date)
 
         return spread_curves
 
@@ -260,44 +316,11 @@ class CorporateCurveBuilder:
             True if successful
         """
         try:
-            # Check if curve already exists
-            existing = self.db.query(BootstrappedCurve).filter_by(
-                curve_type=curve_data['curve_type'],
-                curve_date=curve_data['curve_date']
-            ).first()
-
-            if existing:
-                # Update existing curve
-                existing.maturities = curve_data['maturities']
-                existing.yields = curve_data['yields']
-                existing.discount_factors = curve_data.get('discount_factors')
-                existing.forward_rates = curve_data.get('forward_rates')
-                existing.curve_metadata = {
-                    'ratings': curve_data.get('ratings'),
-                    'interpolated_maturities': curve_data.get('interpolated_maturities'),
-                    'interpolated_yields': curve_data.get('interpolated_yields'),
-                    'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD,
-                }
-            else:
-                # Create new curve
-                curve = BootstrappedCurve(
-                    curve_type=curve_data['curve_type'],
-                    curve_date=curve_data['curve_date'],
-                    maturities=curve_data['maturities'],
-                    yields=curve_data['yields'],
-                    discount_factors=curve_data.get('discount_factors'),
-                    forward_rates=curve_data.get('forward_rates'),
-                    curve_metadata={
-                        'ratings': curve_data.get('ratings'),
-                        'interpolated_maturities': curve_data.get('interpolated_maturities'),
-                        'interpolated_yields': curve_data.get('interpolated_yields'),
-                        'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD,
-                    }
-                )
-                self.db.add(curve)
-
+            upsert_bootstrapped_curves(self.db, [self._curve_row(curve_data)])
             self.db.commit()
-            logger.debug(f"Stored Corporate curve for {curve_data['curve_date']}")
+            _curve_cache.clear()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored Corporate curve for %s", curve_data['curve_date'])
             return True
 
         except Exception as e:
@@ -305,6 +328,56 @@ class CorporateCurveBuilder:
             self.db.rollback()
             return False
 
+    def _curve_row(self, curve_data: Dict) -> Dict:
+        """
+        Convert built curve data to BootstrappedCurve column values.
+
+        Args:
+            curve_data: Curve data dictionary
+
+        Returns:
+            Row dictionary for upsert_bootstrapped_curves
+        """
+        # Kept as raw float64 bytes rather than a JSON list
+        discount_factors = curve_data.get('discount_factors')
+        discount_factors_blob = (
+            np.asarray(discount_factors, dtype=np.float64).tobytes()
+            if discount_factors is not None else None
+        )
+
+        # Dense curve stays an array until it is written out as JSON
+        interpolated_maturities = curve_data.get('interpolated_maturities')
+        interpolated_yields = curve_data.get('interpolated_yields')
+        if interpolated_maturities is not None:
+            interpolated_maturities = np.asarray(interpolated_maturities, dtype=np.float64)
+            interpolated_yields = np.asarray(interpolated_yields, dtype=np.float64)
+
+        return {
+            'curve_type': curve_data['curve_type'],
+            'curve_date': curve_data['curve_date'],
+            'maturities': curve_data['maturities'],
+            'yields': curve_data['yields'],
+            'discount_factors': None,
+            'discount_factors_blob': discount_factors_blob,
+            'forward_rates': curve_data.get('forward_rates'),
+            'curve_metadata': {
+                'ratings': curve_data.get('ratings'),
+                'interpolated_maturities': (
+                    interpolated_maturities.tolist() if interpolated_maturities is not None else None
+                ),
+                'interpolated_yields': (
+                    interpolated_yields.tolist() if interpolated_yields is not None else None
+                ),
+                'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD,
+            },
+            # Downsample once here so reads with a common max_points skip it
+            'downsampled_curves': precompute_downsampled_curves(
+                interpolated_maturities,
+                interpolated_yields,
+                config.CURVE_DOWNSAMPLE_SIZES
+            ),
+        }
+
     def store_spread_curve(self, spread_data: Dict) -> bool:
         """
         Store corporate spread curve in database.
@@ -316,34 +389,7 @@ class CorporateCurveBuilder:
             True if successful
         """
         try:
-            # Check if spread curve already exists
-            existing = self.db.query(CorporateSpreadCurve).filter_by(
-                rating=spread_data['rating'],
-                curve_date=spread_data['curve_date']
-            ).first()
-
-            if existing:
-                # Update existing
-                existing.maturities = spread_data['maturities']
-                existing.spreads = spread_data['spreads']
-                existing.yields = spread_data['corporate_yields']
-                existing.curve_metadata = {
-                    'treasury_yields': spread_data.get('treasury_yields'),
-                }
-            else:
-                # Create new
-                spread_curve = CorporateSpreadCurve(
-                    rating=spread_data['rating'],
-                    curve_date=spread_data['curve_date'],
-                    maturities=spread_data['maturities'],
-                    spreads=spread_data['spreads'],
-                    yields=spread_data['corporate_yields'],
-                    curve_metadata={
-                        'treasury_yields': spread_data.get('treasury_yields'),
-                    }
-                )
-                self.db.add(spread_curve)
-
+            upsert_spread_curves(self.db, [self._spread_curve_row(spread_data)])
             self.db.commit()
             return True
 
@@ -352,10 +398,66 @@ class CorporateCurveBuilder:
             self.db.rollback()
             return False
 
+    def _spread_curve_row(self, spread_data: Dict) -> Dict:
+        """
+        Convert built spread curve data to CorporateSpreadCurve column values.
+
+        Args:
+            spread_data: Spread curve data dictionary
+
+        Returns:
+            Row dictionary for upsert_spread_curves
+        """
+        return {
+            'rating': spread_data['rating'],
+            'curve_date': spread_data['curve_date'],
+            'maturities': spread_data['maturities'],
+            'spreads': spread_data['spreads'],
+            'yields': spread_data['corporate_yields'],
+            'curve_metadata': {
+                'treasury_yields': spread_data.get('treasury_yields'),
+            },
+        }
+
+    def _store_curve_rows(
+        self,
+        curve_rows: List[Dict],
+        spread_rows: List[Dict],
+        commit: bool = True
+    ) -> bool:
+        """
+        Upsert and commit one chunk of built curves and their spread curves.
+
+        Args:
+            curve_rows: Rows for upsert_bootstrapped_curves
+            spread_rows: Rows for upsert_spread_curves
+            commit: Commit the chunk; if False it is only flushed and a failed
+                upsert is raised for the caller to roll back
+
+        Returns:
+            True if stored, False if the chunk was rolled back
+        """
+        try:
+            upsert_bootstrapped_curves(self.db, curve_rows)
+            upsert_spread_curves(self.db, spread_rows)
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+            return True
+        except Exception as e:
+            if not commit:
+                raise
+            logger.error(f"Failed to store Corporate curves: {str(e)}")
+            self.db.rollback()
+            return False
+
     def build_curves_for_date_range(
         self,
         start_date: date,
-        end_date: date
+        end_date: date,
+        commit: bool = True,
+        build_spreads: bool = True
     ) -> Tuple[int, int]:
         """
         Build corporate curves for a date range.
@@ -363,36 +465,90 @@ class CorporateCurveBuilder:
         Args:
             start_date: Start date
             end_date: End date
+            commit: Commit each chunk of curves; if False they are only
+                flushed, for callers that commit them together with the raw
+                data they were built from, and a failed upsert raises
+            build_spreads: Also build spread curves over the stored Treasury
+                curves; if False the Treasury curves are not read at all
 
         Returns:
             Tuple of (successful_count, failed_count)
         """
         logger.info(f"Building Corporate curves from {start_date} to {end_date}")
 
-        # Get all unique dates with data
-        dates = self.db.query(RawYieldData.date).filter(
+        # Read the window's raw yields and Treasury curves with one query
+        # each, instead of several queries per date
+        raw_rows = self.db.query(
+            RawYieldData.date,
+            RawYieldData.series_name,
+            RawYieldData.value
+        ).filter(
             RawYieldData.data_type == 'corporate',
             RawYieldData.date >= start_date,
             RawYieldData.date <= end_date
-        ).distinct().order_by(RawYieldData.date).all()
+        ).all()
 
-        unique_dates = [d[0] for d in dates]
+        values_by_date: Dict[date, Dict[str, float]] = {}
+        for curve_date, series_name, value in raw_rows:
+            values = values_by_date.setdefault(curve_date, {})
+            if value is not None:
+                values[series_name] = value
+
+        treasury_curves = {} if not build_spreads else {
+            curve_date: (maturities, yields)
+            for curve_date, maturities, yields in self.db.query(
+                BootstrappedCurve.curve_date,
+                BootstrappedCurve.maturities,
+                BootstrappedCurve.yields
+            ).filter(
+                BootstrappedCurve.curve_type == 'treasury',
+                BootstrappedCurve.curve_date >= start_date,
+                BootstrappedCurve.curve_date <= end_date
+            )
+        }
 
         successful = 0
         failed = 0
 
-        for curve_date in unique_dates:
-            # Build main curve
-            curve_data = self.build_curve(curve_date)
-            if curve_data and self.store_curve(curve_data):
-                successful += 1
+        # Store in chunks of dates so a long range never holds every dense
+        # curve in memory and, when committing per chunk, a failed upsert
+        # only loses its own
+        curve_dates = sorted(values_by_date)
+        size = config.CURVE_UPSERT_CHUNK_SIZE
+        for start in range(0, len(curve_dates), size):
+            curve_rows = []
+            spread_rows = []
+
+            for curve_date in curve_dates[start:start + size]:
+                values = values_by_date[curve_date]
+                curve_data = self.build_curve_from_values(curve_date, values)
+                if not curve_data:
+                    failed += 1
+                    continue
+                curve_rows.append(self._curve_row(curve_data))
 
                 # Build spread curves
-                spread_curves = self.build_spread_curves(curve_date)
-                for spread_curve in spread_curves:
-                    self.store_spread_curve(spread_curve)
+                if not build_spreads:
+                    continue
+                treasury_curve = treasury_curves.get(curve_date)
+                if treasury_curve is None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("No Treasury curve found for %s, skipping spreads", curve_date)
+                    continue
+                spread_rows.extend(
+                    self._spread_curve_row(spread_curve)
+                    for spread_curve in self.build_spread_curves_from_values(
+                        curve_date, treasury_curve[0], treasury_curve[1], values
+                    )
+                )
+
+            if self._store_curve_rows(curve_rows, spread_rows, commit):
+                successful += len(curve_rows)
             else:
-                failed += 1
+                failed += len(curve_rows)
+
+        if successful:
+            _curve_cache.clear()
 
         logger.info(
             f"Built Corporate curves: {successful} successful, {failed} failed"
@@ -404,6 +560,24 @@ class CorporateCurveBuilder:
         """
         Retrieve stored corporate curve for a specific date.
 
+        Args:
+            curve_date: Date of the curve
+            max_points: Maximum number of interpolated points to return (for performance)
+
+        Returns:
+            Curve data dictionary or None. The dictionary is memoized and
+            shared between callers, so it must not be modified.
+        """
+        return _curve_cache.get_or_compute(
+            (curve_date, max_points),
+            lambda: self._load_curve(curve_date, max_points),
+            config.RESPONSE_CACHE_TTL
+        )
+
+    def _load_curve(self, curve_date: date, max_points: Optional[int] = None) -> Optional[Dict]:
+        """
+        Load a stored corporate curve for a specific date from the database.
+
         Args:
             curve_date: Date of the curve
             max_points: Maximum number of interpolated points to return (for performance)
@@ -419,33 +593,76 @@ class CorporateCurveBuilder:
         if not curve:
             return None
 
-        # Use interpolated curves if available, otherwise use original
-        interpolated_maturities = curve.curve_metadata.get('interpolated_maturities') if curve.curve_metadata else None
-        interpolated_yields = curve.curve_metadata.get('interpolated_yields') if curve.curve_metadata else None
+        return self._curve_to_dict(curve, max_points)
 
-        # Downsample if requested
-        if max_points and interpolated_maturities and len(interpolated_maturities) > max_points:
-            import numpy as np
-            indices = np.linspace(0, len(interpolated_maturities) - 1, max_points, dtype=int)
-            interpolated_maturities = [interpolated_maturities[i] for i in indices]
-            interpolated_yields = [interpolated_yields[i] for i in indices]
+    def _curve_to_dict(self, curve: BootstrappedCurve, max_points: Optional[int] = None) -> Dict:
+        """
+        Convert a stored corporate curve row to its API dictionary.
+
+        Args:
+            curve: Stored curve row
+            max_points: Maximum number of interpolated points to return
+
+        Returns:
+            Curve data dictionary
+        """
+        precomputed = (curve.downsampled_curves or {}).get(str(max_points)) if max_points else None
+
+        if precomputed:
+            interpolated_maturities = precomputed['maturities']
+            interpolated_yields = precomputed['yields']
+        else:
+            # Use interpolated curves if available, otherwise use original
+            interpolated_maturities = curve.curve_metadata.get('interpolated_maturities') if curve.curve_metadata else None
+            interpolated_yields = curve.curve_metadata.get('interpolated_yields') if curve.curve_metadata else None
+
+            # Downsample if requested
+            if interpolated_maturities:
+                interpolated_maturities, interpolated_yields = downsample_curve(
+                    interpolated_maturities, interpolated_yields, max_points
+                )
+
+        if curve.discount_factors_blob is not None:
+            discount_factors = np.frombuffer(curve.discount_factors_blob, dtype=np.float64).tolist()
+        else:
+            discount_factors = curve.discount_factors
 
         return {
             'curve_type': curve.curve_type,
             'curve_date': curve.curve_date.isoformat(),
             'maturities': interpolated_maturities if interpolated_maturities else curve.maturities,
             'yields': interpolated_yields if interpolated_yields else curve.yields,
-            'discount_factors': curve.discount_factors,
+            'discount_factors': discount_factors,
             'forward_rates': curve.forward_rates,
             'original_maturities': curve.maturities,  # Keep original sparse points
             'original_yields': curve.yields,
             'ratings': curve.curve_metadata.get('ratings') if curve.curve_metadata else None,
         }
 
-    def get_latest_curve(self) -> Optional[Dict]:
+    def get_latest_curve(self, max_points: Optional[int] = None) -> Optional[Dict]:
         """
         Get the most recent corporate curve.
 
+        Args:
+            max_points: Maximum number of interpolated points to return (for performance)
+
+        Returns:
+            Latest curve data or None. The dictionary is memoized and shared
+            between callers, so it must not be modified.
+        """
+        return _curve_cache.get_or_compute(
+            ('latest', max_points),
+            lambda: self._load_latest_curve(max_points),
+            config.RESPONSE_CACHE_LATEST_TTL
+        )
+
+    def _load_latest_curve(self, max_points: Optional[int] = None) -> Optional[Dict]:
+        """
+        Load the most recent corporate curve from the database.
+
+        Args:
+            max_points: Maximum number of interpolated points to return (for performance)
+
         Returns:
             Latest curve data or None
         """
@@ -456,7 +673,7 @@ class CorporateCurveBuilder:
         if not curve:
             return None
 
-        return self.get_curve(curve.curve_date)
+        return self._curve_to_dict(curve, max_points)
 
     def get_spread_curve(self, rating: str, curve_date: date) -> Optional[Dict]:
         """
@@ -485,3 +702,34 @@ class CorporateCurveBuilder:
             'yields': spread_curve.yields,
             'treasury_yields': spread_curve.curve_metadata.get('treasury_yields') if spread_curve.curve_metadata else None,
         }
+
+    def get_all_spread_curves(self, curve_date: date) -> Dict[str, Dict]:
+        """
+        Get spread curves for every rating on a date in a single query.
+
+        Args:
+            curve_date: Date
+
+        Returns:
+            Dictionary of rating -> spread curve data, in config order
+        """
+        rows = self.db.query(CorporateSpreadCurve).filter_by(
+            curve_date=curve_date
+        ).all()
+
+        by_rating = {row.rating: row for row in rows}
+        ordered = [r for r in config.CORPORATE_TENORS if r in by_rating]
+        ordered += sorted(r for r in by_rating if r not in config.CORPORATE_SERIES)
+
+        return {
+            rating: {
+                'maturities': by_rating[rating].maturities,
+                'spreads': by_rating[rating].spreads,
+                'yields': by_rating[rating].yields,
+                'treasury_yields': (
+                    by_rating[rating].curve_metadata.get('treasury_yields')
+                    if by_rating[rating].curve_metadata else None
+                ),
+            }
+            for rating in ordered
+        }
@@ -1,15 +1,215 @@
 """
 FRED API client for fetching Treasury and Corporate bond data.
 """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import re
+import threading
+import time
+from urllib.error import HTTPError
+import weakref
+import httpx
+import numpy as np
+import orjson
 import pandas as pd
 from fredapi import Fred
 import logging
 import config
+from src.utils.cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
+# Fetched frames on disk, so re-running history loads does not repeat them
+_fred_cache = DiskCache(config.FRED_CACHE_DIR) if config.FRED_CACHE_DIR is not None else None
+
+# Async request caps, one per event loop: the Treasury and Corporate fetches
+# are gathered on the same loop, each with its own client, and share it
+_request_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Request URLs carry the key as a query parameter
+_API_KEY_PARAM = re.compile(r'(api_key=)[^&\s\'"]+')
+
+
+def redact_api_key(text: str) -> str:
+    """
+    Mask the FRED API key in text that may contain a request URL.
+
+    Args:
+        text: Message or traceback text
+
+    Returns:
+        Text with every api_key query parameter value replaced
+    """
+    return _API_KEY_PARAM.sub(r'\1REDACTED', text)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """
+    Decide whether a failed FRED request may succeed when retried.
+
+    Responses with a status in config.FRED_PERMANENT_HTTP_STATUSES (a bad
+    request, key or series) are permanent; rate limiting, server errors and
+    network failures are not. fredapi re-raises HTTP errors as a ValueError
+    whose context is the original urllib HTTPError.
+
+    Args:
+        error: Exception raised by the sync or async fetch
+
+    Returns:
+        True if the request should be retried
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+    elif isinstance(error.__context__, HTTPError):
+        status = error.__context__.code
+    else:
+        return True
+    return status not in config.FRED_PERMANENT_HTTP_STATUSES
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    """
+    Semaphore capping concurrent FRED requests on the running event loop.
+
+    Created per loop because every refresh runs its fetches under a new
+    asyncio.run(), and a semaphore must not be shared across loops.
+
+    Returns:
+        Semaphore sized by config.FRED_MAX_CONCURRENT_REQUESTS
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(config.FRED_MAX_CONCURRENT_REQUESTS)
+        _request_semaphores[loop] = semaphore
+    return semaphore
+
+
+def safe_error_message(error: BaseException) -> str:
+    """
+    Describe an exception for logs without leaking the FRED API key.
+
+    httpx status errors include the full request URL in their message, so
+    only their status code is reported; other messages are redacted.
+
+    Args:
+        error: Exception raised while talking to FRED
+
+    Returns:
+        Exception type and a key-free message
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"{type(error).__name__}: HTTP {error.response.status_code}"
+    return redact_api_key(f"{type(error).__name__}: {error}")
+
+
+@lru_cache(maxsize=256)
+def _series_info_cached(api_key: str, series_id: str) -> Dict:
+    """
+    Fetch series metadata once per process.
+
+    Title, frequency and units practically never change, so repeated lookups
+    during ingest skip the network round-trip. Errors propagate and are not
+    cached.
+    """
+    info = Fred(api_key=api_key).get_series_info(series_id)
+    return {
+        'id': info.get('id'),
+        'title': info.get('title'),
+        'observation_start': info.get('observation_start'),
+        'observation_end': info.get('observation_end'),
+        'frequency': info.get('frequency'),
+        'units': info.get('units'),
+        'seasonal_adjustment': info.get('seasonal_adjustment'),
+    }
+
+
+def _corporate_series_map(series_names: Optional[Sequence[str]]) -> Dict[str, str]:
+    """
+    Select the corporate series to fetch.
+
+    Args:
+        series_names: Subset of config.CORPORATE_SERIES names, or None for all
+
+    Returns:
+        Mapping of series name to FRED series ID
+
+    Raises:
+        ValueError: If series_names contains an unknown series
+    """
+    if series_names is None:
+        return config.CORPORATE_SERIES
+
+    unknown = [name for name in series_names if name not in config.CORPORATE_SERIES]
+    if unknown:
+        raise ValueError(f"Unknown corporate series: {', '.join(unknown)}")
+    return {name: config.CORPORATE_SERIES[name] for name in series_names}
+
+
+def _fred_cache_key(
+    series_map: Dict[str, str],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple:
+    return (tuple(series_map.items()), start_date, end_date)
+
+
+def _load_cached_frame(
+    series_map: Dict[str, str],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Optional[pd.DataFrame]:
+    """
+    Look up a previously fetched frame in the FRED response cache.
+
+    Args:
+        series_map: Mapping of column name to FRED series ID
+        start_date: Start date (YYYY-MM-DD format)
+        end_date: End date (YYYY-MM-DD format)
+
+    Returns:
+        Cached DataFrame, or None on a miss or when the cache is disabled
+    """
+    if _fred_cache is None:
+        return None
+    return _fred_cache.get(_fred_cache_key(series_map, start_date, end_date))
+
+
+def _save_cached_frame(
+    series_map: Dict[str, str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    df: pd.DataFrame
+):
+    """
+    Store a fetched frame in the FRED response cache.
+
+    Observations of past months no longer change, so a fetch ending before
+    the current month is kept indefinitely; one reaching into the current
+    month (or open-ended) expires after config.FRED_CACHE_RECENT_TTL.
+    Incomplete fetches are not cached.
+
+    Args:
+        series_map: Mapping of column name to FRED series ID
+        start_date: Start date (YYYY-MM-DD format)
+        end_date: End date (YYYY-MM-DD format)
+        df: Combined DataFrame returned by the fetch
+    """
+    if _fred_cache is None or df.empty or len(df.columns) < len(series_map):
+        return
+
+    month_start = datetime.today().date().replace(day=1)
+    if end_date is not None and datetime.strptime(end_date, '%Y-%m-%d').date() < month_start:
+        ttl = None
+    else:
+        ttl = config.FRED_CACHE_RECENT_TTL
+    _fred_cache.set(_fred_cache_key(series_map, start_date, end_date), df, ttl)
+
 
 class FREDClient:
     """Client for interacting with FRED API."""
@@ -23,8 +223,31 @@ class FREDClient:
         """
         self.fred = Fred(api_key=api_key)
         self.api_key = api_key
+        self._validated = False
+        self._validation_lock = threading.Lock()
         logger.info("FRED client initialized successfully")
 
+    def _ensure_validated(self):
+        """
+        Validate the API key once, on the first request that needs FRED.
+
+        The result is kept for the lifetime of the client, so only the first
+        fetch pays the validation round-trip.
+
+        Raises:
+            ValueError: If the API key is rejected by FRED
+        """
+        if self._validated:
+            return
+
+        with self._validation_lock:
+            if self._validated:
+                return
+            if not self.validate_api_key():
+                raise ValueError("FRED API key is invalid or FRED is unreachable")
+            self._validated = True
+            logger.info("FRED API key validated")
+
     def fetch_treasury_data(
         self,
         start_date: Optional[str] = None,
@@ -41,86 +264,218 @@ class FREDClient:
             DataFrame with dates as index and treasury series as columns
         """
         logger.info(f"Fetching Treasury data from {start_date or 'beginning'} to {end_date or 'today'}")
+        return self._fetch_series_batch(config.TREASURY_SERIES, "Treasury", start_date, end_date)
 
-        all_data = {}
-        successful_series = []
-        failed_series = []
+    def fetch_corporate_data(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        series_names: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch corporate bond index data.
 
-        for tenor, series_id in config.TREASURY_SERIES.items():
-            try:
-                series = self.fred.get_series(
-                    series_id,
-                    observation_start=start_date,
-                    observation_end=end_date
-                )
-                all_data[tenor] = series
-                successful_series.append(f"{tenor} ({series_id})")
-                logger.debug(f"Successfully fetched {tenor}: {len(series)} observations")
-            except Exception as e:
-                logger.error(f"Failed to fetch {tenor} ({series_id}): {str(e)}")
-                failed_series.append(f"{tenor} ({series_id})")
+        Args:
+            start_date: Start date (YYYY-MM-DD format). If None, fetches all available data.
+            end_date: End date (YYYY-MM-DD format). If None, uses today.
+            series_names: Subset of config.CORPORATE_SERIES names to fetch. If None, fetches all.
 
-        if not all_data:
-            raise ValueError("Failed to fetch any Treasury data from FRED")
+        Returns:
+            DataFrame with dates as index and corporate series as columns
 
-        # Combine into single DataFrame
-        df = pd.DataFrame(all_data)
-        df.index.name = 'date'
+        Raises:
+            ValueError: If series_names contains an unknown series
+        """
+        series_map = _corporate_series_map(series_names)
+        logger.info(f"Fetching Corporate data from {start_date or 'beginning'} to {end_date or 'today'}")
+        return self._fetch_series_batch(series_map, "Corporate", start_date, end_date)
 
-        logger.info(
-            f"Treasury data fetch complete. "
-            f"Successful: {len(successful_series)}, Failed: {len(failed_series)}"
-        )
+    async def fetch_treasury_data_async(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch all US Treasury yield data without blocking the event loop.
 
-        if failed_series:
-            logger.warning(f"Failed series: {', '.join(failed_series)}")
+        Same result as fetch_treasury_data, for callers already running
+        inside asyncio.
 
-        return df
+        Args:
+            start_date: Start date (YYYY-MM-DD format). If None, fetches all available data.
+            end_date: End date (YYYY-MM-DD format). If None, uses today.
 
-    def fetch_corporate_data(
+        Returns:
+            DataFrame with dates as index and treasury series as columns
+        """
+        logger.info(f"Fetching Treasury data from {start_date or 'beginning'} to {end_date or 'today'}")
+        return await self._fetch_series_batch_async(config.TREASURY_SERIES, "Treasury", start_date, end_date)
+
+    async def fetch_corporate_data_async(
         self,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        series_names: Optional[Sequence[str]] = None
     ) -> pd.DataFrame:
         """
-        Fetch all corporate bond index data.
+        Fetch corporate bond index data without blocking the event loop.
+
+        Same result as fetch_corporate_data, for callers already running
+        inside asyncio.
 
         Args:
             start_date: Start date (YYYY-MM-DD format). If None, fetches all available data.
             end_date: End date (YYYY-MM-DD format). If None, uses today.
+            series_names: Subset of config.CORPORATE_SERIES names to fetch. If None, fetches all.
 
         Returns:
             DataFrame with dates as index and corporate series as columns
+
+        Raises:
+            ValueError: If series_names contains an unknown series
         """
+        series_map = _corporate_series_map(series_names)
         logger.info(f"Fetching Corporate data from {start_date or 'beginning'} to {end_date or 'today'}")
+        return await self._fetch_series_batch_async(series_map, "Corporate", start_date, end_date)
+
+    def _fetch_series_batch(
+        self,
+        series_map: Dict[str, str],
+        label: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Fetch several series concurrently and combine them into one DataFrame.
+
+        Each series is an independent HTTP round-trip, so they are dispatched on a
+        thread pool and the total time is bound by the slowest series. Frames
+        already in the FRED response cache are returned without any request.
+
+        Args:
+            series_map: Mapping of column name to FRED series ID
+            label: Data set name used in log messages
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+
+        Returns:
+            DataFrame with dates as index and one column per series
+        """
+        cached = _load_cached_frame(series_map, start_date, end_date)
+        if cached is not None:
+            logger.info(f"Loaded {label} data from the FRED response cache")
+            return cached
+
+        self._ensure_validated()
+        max_workers = max(1, min(config.FRED_MAX_WORKERS, len(series_map)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._get_series_with_retry, series_id, start_date, end_date)
+                for series_id in series_map.values()
+            ]
+
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+
+        df = self._combine_series(series_map, label, results)
+        _save_cached_frame(series_map, start_date, end_date, df)
+        return df
 
+    async def _fetch_series_batch_async(
+        self,
+        series_map: Dict[str, str],
+        label: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Fetch several series concurrently on one pooled async HTTP client.
+
+        Frames already in the FRED response cache are returned without any
+        request.
+
+        Args:
+            series_map: Mapping of column name to FRED series ID
+            label: Data set name used in log messages
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+
+        Returns:
+            DataFrame with dates as index and one column per series
+        """
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, _load_cached_frame, series_map, start_date, end_date)
+        if cached is not None:
+            logger.info(f"Loaded {label} data from the FRED response cache")
+            return cached
+
+        await loop.run_in_executor(None, self._ensure_validated)
+        limits = httpx.Limits(max_connections=config.FRED_MAX_WORKERS)
+        async with httpx.AsyncClient(limits=limits, timeout=config.FRED_HTTP_TIMEOUT) as client:
+            results = await asyncio.gather(
+                *(
+                    self._get_series_async(client, series_id, start_date, end_date)
+                    for series_id in series_map.values()
+                ),
+                return_exceptions=True
+            )
+
+        df = self._combine_series(series_map, label, results)
+        await loop.run_in_executor(None, _save_cached_frame, series_map, start_date, end_date, df)
+        return df
+
+    def _combine_series(
+        self,
+        series_map: Dict[str, str],
+        label: str,
+        results: List[Union[pd.Series, Exception]]
+    ) -> pd.DataFrame:
+        """
+        Combine per-series results into one DataFrame, logging failures.
+
+        Args:
+            series_map: Mapping of column name to FRED series ID
+            label: Data set name used in log messages
+            results: Fetched series or the raised exception, in series_map order
+
+        Returns:
+            DataFrame with dates as index and one column per fetched series
+        """
         all_data = {}
         successful_series = []
         failed_series = []
 
-        for rating, series_id in config.CORPORATE_SERIES.items():
-            try:
-                series = self.fred.get_series(
-                    series_id,
-                    observation_start=start_date,
-                    observation_end=end_date
-                )
-                all_data[rating] = series
-                successful_series.append(f"{rating} ({series_id})")
-                logger.debug(f"Successfully fetched {rating}: {len(series)} observations")
-            except Exception as e:
-                logger.error(f"Failed to fetch {rating} ({series_id}): {str(e)}")
-                failed_series.append(f"{rating} ({series_id})")
+        # Collect in config order so the column order stays stable
+        for (name, series_id), result in zip(series_map.items(), results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch {name} ({series_id}): {safe_error_message(result)}")
+                failed_series.append(f"{name} ({series_id})")
+            else:
+                all_data[name] = result
+                successful_series.append(f"{name} ({series_id})")
+                logger.debug(f"Successfully fetched {name}: {len(result)} observations")
 
         if not all_data:
-            raise ValueError("Failed to fetch any Corporate data from FRED")
+            raise ValueError(f"Failed to fetch any {label} data from FRED")
 
-        # Combine into single DataFrame
-        df = pd.DataFrame(all_data)
-        df.index.name = 'date'
+        # Align every series on one shared date index and wrap a single 2-D
+        # array, instead of letting the constructor align series one by one
+        common_index = pd.DatetimeIndex(
+            np.unique(np.concatenate([series.index.values for series in all_data.values()])),
+            name='date'
+        )
+        values = np.column_stack([
+            series.reindex(common_index).to_numpy(dtype=config.FRED_VALUE_DTYPE)
+            for series in all_data.values()
+        ])
+        df = pd.DataFrame(values, index=common_index, columns=list(all_data))
 
         logger.info(
-            f"Corporate data fetch complete. "
+            f"{label} data fetch complete. "
             f"Successful: {len(successful_series)}, Failed: {len(failed_series)}"
         )
 
@@ -129,6 +484,137 @@ class FREDClient:
 
         return df
 
+    def _get_series_with_retry(
+        self,
+        series_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> pd.Series:
+        """
+        Fetch a single series, retrying transient failures with exponential backoff.
+
+        FRED intermittently answers with 429 (rate limit) or a server error, so
+        a failed request is retried up to config.FRED_MAX_RETRIES times unless
+        _is_retryable rejects it.
+
+        Args:
+            series_id: FRED series ID
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+
+        Returns:
+            Series of observations indexed by date
+        """
+        for attempt in range(config.FRED_MAX_RETRIES):
+            try:
+                return self.fred.get_series(
+                    series_id,
+                    observation_start=start_date,
+                    observation_end=end_date
+                )
+            except Exception as e:
+                if not _is_retryable(e) or attempt == config.FRED_MAX_RETRIES - 1:
+                    raise
+                delay = config.FRED_RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"Retrying {series_id} in {delay:.1f}s after error: {safe_error_message(e)}")
+                time.sleep(delay)
+
+    async def _get_series_async(
+        self,
+        client: httpx.AsyncClient,
+        series_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> pd.Series:
+        """
+        Fetch a single series from the observations endpoint, with retries.
+
+        Transient failures are retried with exponential backoff, with the
+        same policy as the sync path (_is_retryable). Each request holds the
+        loop's request semaphore, the backoff does not.
+
+        Args:
+            client: Shared async HTTP client
+            series_id: FRED series ID
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+
+        Returns:
+            Series of observations indexed by date (missing values are NaN)
+        """
+        params = {'series_id': series_id, 'api_key': self.api_key, 'file_type': 'json'}
+        if start_date:
+            params['observation_start'] = start_date
+        if end_date:
+            params['observation_end'] = end_date
+
+        semaphore = _request_semaphore()
+        for attempt in range(config.FRED_MAX_RETRIES):
+            try:
+                async with semaphore:
+                    response = await client.get(config.FRED_OBSERVATIONS_URL, params=params)
+                response.raise_for_status()
+                break
+            except httpx.HTTPError as e:
+                if not _is_retryable(e) or attempt == config.FRED_MAX_RETRIES - 1:
+                    raise
+                delay = config.FRED_RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"Retrying {series_id} in {delay:.1f}s after error: {safe_error_message(e)}")
+                await asyncio.sleep(delay)
+
+        observations = orjson.loads(response.content)['observations']
+        # FRED marks missing observations with '.'
+        values = np.array(
+            [np.nan if obs['value'] == '.' else float(obs['value']) for obs in observations],
+            dtype=np.float64
+        )
+        index = pd.to_datetime([obs['date'] for obs in observations])
+        return pd.Series(values, index=index, name=series_id)
+
+    def fetch_series_all_releases(self, series_id: str) -> pd.DataFrame:
+        """
+        Fetch every released revision of a series.
+
+        FRED returns HTTP 400 when a request spans 2000 or more vintages, which
+        long-running daily series exceed. The vintage dates are fetched first and
+        split into windows of config.FRED_MAX_VINTAGES_PER_REQUEST so no request
+        is ever rejected.
+
+        Args:
+            series_id: FRED series ID
+
+        Returns:
+            DataFrame with realtime_start, date and value columns
+        """
+        self._ensure_validated()
+        vintage_dates = self.fred.get_series_vintage_dates(series_id)
+        if not vintage_dates:
+            return pd.DataFrame(columns=['realtime_start', 'date', 'value'])
+
+        chunk_size = config.FRED_MAX_VINTAGES_PER_REQUEST
+        chunks = [
+            vintage_dates[i:i + chunk_size]
+            for i in range(0, len(vintage_dates), chunk_size)
+        ]
+
+        frames = []
+        for chunk in chunks:
+            frames.append(self.fred.get_series_all_releases(
+                series_id,
+                realtime_start=chunk[0].strftime('%Y-%m-%d'),
+                realtime_end=chunk[-1].strftime('%Y-%m-%d')
+            ))
+
+        # Adjacent windows can both report the observation valid at the boundary
+        releases = pd.concat(frames, ignore_index=True)
+        releases = releases.drop_duplicates(subset=['realtime_start', 'date'], keep='last')
+
+        logger.debug(
+            f"Fetched {len(releases)} releases of {series_id} in {len(chunks)} request(s)"
+        )
+
+        return releases.reset_index(drop=True)
+
     def fetch_series_info(self, series_id: str) -> Dict:
         """
         Fetch metadata about a specific series.
@@ -140,20 +626,18 @@ class FREDClient:
             Dictionary containing series metadata
         """
         try:
-            info = self.fred.get_series_info(series_id)
-            return {
-                'id': info.get('id'),
-                'title': info.get('title'),
-                'observation_start': info.get('observation_start'),
-                'observation_end': info.get('observation_end'),
-                'frequency': info.get('frequency'),
-                'units': info.get('units'),
-                'seasonal_adjustment': info.get('seasonal_adjustment'),
-            }
+            self._ensure_validated()
+            # Copy so callers cannot modify the cached entry
+            return dict(_series_info_cached(self.api_key, series_id))
         except Exception as e:
-            logger.error(f"Failed to fetch info for {series_id}: {str(e)}")
+            logger.error(f"Failed to fetch info for {series_id}: {safe_error_message(e)}")
             return {}
 
+    def refresh_metadata(self):
+        """Drop cached series metadata so the next lookups query FRED again."""
+        _series_info_cached.cache_clear()
+        logger.info("Cleared cached FRED series metadata")
+
     def get_latest_observation_date(self, series_id: str) -> Optional[datetime]:
         """
         Get the latest observation date for a series.
@@ -165,11 +649,12 @@ class FREDClient:
             Latest observation date or None if not available
         """
         try:
+            self._ensure_validated()
             series = self.fred.get_series(series_id)
             if series is not None and len(series) > 0:
                 return series.index[-1].to_pydatetime()
         except Exception as e:
-            logger.error(f"Failed to get latest date for {series_id}: {str(e)}")
+            logger.error(f"Failed to get latest date for {series_id}: {safe_error_message(e)}")
         return None
 
     def validate_api_key(self) -> bool:
@@ -184,5 +669,5 @@ class FREDClient:
             test_series = self.fred.get_series('DGS10', observation_start='2020-01-01', observation_end='2020-01-31')
             return test_series is not None and len(test_series) > 0
         except Exception as e:
-            logger.error(f"API key validation failed: {str(e)}")
+            logger.error(f"API key validation failed: {safe_error_message(e)}")
             return False
@@ -1,19 +1,153 @@
 """
 US Treasury Curve Builder.
 """
-from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
+import multiprocessing
+from typing import Iterator, List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 import logging
 
 import config
-from src.models.database import RawYieldData, BootstrappedCurve
-from src.utils.bootstrapping import YieldCurveBootstrapper, validate_curve_data
+from src.models.database import (
+    RawYieldData,
+    BootstrappedCurve,
+    TreasuryCurveBlock,
+    upsert_bootstrapped_curves,
+    upsert_raw_yield_data,
+)
+from src.utils.bootstrapping import (
+    YieldCurveBootstrapper,
+    downsample_curve,
+    precompute_downsampled_curves,
+    validate_curve_data,
+)
+from src.utils.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Curve dictionaries read back from the database, keyed by
+# (curve_date or 'latest', max_points). Cleared when curves are stored here
+# and, through the refresh marker, when another process refreshes.
+_curve_cache = ResponseCache(config.CURVE_CACHE_SIZE)
+
+# Treasury tenor -> FRED series ID, built once so store_raw_data maps with a hash lookup
+_SERIES_MAP = pd.Series(dict(config.TREASURY_SERIES))
+
+# Monthly blocks store yields as int16 basis points (FRED quotes 2 decimals)
+MISSING_BP = np.iinfo(np.int16).min
+
+
+@lru_cache(maxsize=None)
+def _worker_bootstrapper() -> YieldCurveBootstrapper:
+    """Bootstrapper reused by every task a curve build worker process runs."""
+    return YieldCurveBootstrapper(
+        interpolation_method=config.BOOTSTRAPPING_INTERPOLATION_METHOD
+    )
+
+
+def _build_curve_worker(task: Tuple[date, np.ndarray]) -> Tuple[Optional[Dict], Optional[tuple]]:
+    """
+    Build one Treasury curve in a worker process.
+
+    Args:
+        task: Tuple of (curve_date, yields ordered like config.TREASURY_TENORS)
+
+    Returns:
+        Tuple of (curve data or None, log message for the parent to emit or None)
+    """
+    curve_date, yields_arr = task
+    return _bootstrap_treasury_curve(_worker_bootstrapper(), curve_date, yields_arr)
+
+
+def _log_curve_result(result: Tuple[Optional[Dict], Optional[tuple]]) -> Optional[Dict]:
+    """
+    Log the outcome of a curve build in the calling process.
+
+    Args:
+        result: Tuple returned by _bootstrap_treasury_curve
+
+    Returns:
+        Dictionary containing curve data or None if the build failed
+    """
+    curve_data, message = result
+    if message is not None:
+        logger.log(*message)
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Built Treasury curve for %s with %d points",
+            curve_data['curve_date'], len(curve_data['maturities'])
+        )
+    return curve_data
+
+
+def _bootstrap_treasury_curve(
+    bootstrapper: YieldCurveBootstrapper,
+    curve_date: date,
+    yields_arr: np.ndarray
+) -> Tuple[Optional[Dict], Optional[tuple]]:
+    """
+    Bootstrap and interpolate a Treasury curve from tenor yields.
+
+    Nothing is logged here, so the same code runs in worker processes,
+    which have no logging set up; see _log_curve_result.
+
+    Args:
+        bootstrapper: Bootstrapper to use
+        curve_date: Date of the curve
+        yields_arr: Yields ordered like config.TREASURY_TENORS, NaN where missing
+
+    Returns:
+        Tuple of (curve data or None if insufficient data,
+        logger.log arguments for a skipped or failed date or None)
+    """
+    mask = ~np.isnan(yields_arr)
+    maturities = config.TREASURY_MATURITIES_ARR[mask].tolist()
+    yields = yields_arr[mask].tolist()
+
+    # Validate data
+    is_valid, error_msg = validate_curve_data(
+        maturities,
+        yields,
+        min_points=config.MIN_DATA_POINTS
+    )
+
+    if not is_valid:
+        return None, (logging.DEBUG, "Skipping %s: %s", curve_date, error_msg)
+
+    try:
+        # Bootstrap the curve
+        zero_rates, discount_factors, forward_rates = bootstrapper.bootstrap_zero_curve(
+            maturities,
+            yields
+        )
+
+        # Interpolate to daily granularity
+        interpolated_maturities, interpolated_yields = bootstrapper.interpolate_curve(
+            maturities,
+            zero_rates
+        )
+
+        # Prepare curve data
+        curve_data = {
+            'curve_type': 'treasury',
+            'curve_date': curve_date,
+            'maturities': maturities,
+            'yields': yields,
+            'interpolated_maturities': interpolated_maturities,
+            'interpolated_yields': interpolated_yields,
+            'discount_factors': discount_factors,
+            'forward_rates': forward_rates.tolist(),
+        }
+
+        return curve_data, None
+
+    except Exception as e:
+        return None, (logging.ERROR, f"Failed to build curve for {curve_date}: {str(e)}")
+
 
 class TreasuryCurveBuilder:
     """Build and manage US Treasury yield curves."""
@@ -30,55 +164,45 @@ class TreasuryCurveBuilder:
             interpolation_method=config.BOOTSTRAPPING_INTERPOLATION_METHOD
         )
 
-    def store_raw_data(self, df: pd.DataFrame) -> int:
+    def store_raw_data(self, df: pd.DataFrame, commit: bool = True) -> int:
         """
         Store raw Treasury data in database.
 
         Args:
             df: DataFrame with dates as index and tenors as columns
+            commit: Commit the records; if False they are only flushed, for
+                callers that commit together with the curves they build
 
         Returns:
             Number of records stored
         """
         logger.info(f"Storing raw Treasury data: {len(df)} dates, {len(df.columns)} series")
 
-        records_stored = 0
-
-        for date_idx in df.index:
-            curve_date = date_idx.date() if isinstance(date_idx, pd.Timestamp) else date_idx
-
-            for tenor in df.columns:
-                value = df.loc[date_idx, tenor]
-                series_id = config.TREASURY_SERIES.get(tenor)
-
-                if series_id is None:
-                    continue
-
-                # Check if record exists
-                existing = self.db.query(RawYieldData).filter_by(
-                    series_id=series_id,
-                    date=curve_date
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    if pd.notna(value):
-                        existing.value = float(value)
-                        existing.updated_at = datetime.utcnow()
-                else:
-                    # Create new record
-                    record = RawYieldData(
-                        series_id=series_id,
-                        series_name=tenor,
-                        data_type='treasury',
-                        date=curve_date,
-                        value=float(value) if pd.notna(value) else None
-                    )
-                    self.db.add(record)
-
-                records_stored += 1
-
-        self.db.commit()
+        # Convert the dates once per frame row, before melting multiplies them
+        df = df.set_axis(pd.DatetimeIndex(df.index).date, axis=0)
+
+        # Only configured series are stored; resolve their IDs once per column
+        df = df.loc[:, df.columns.isin(_SERIES_MAP.index)]
+
+        # One row per (date, series) in a single vectorized reshape. melt()
+        # stacks whole columns, so each column's ID is simply repeated
+        long = df.reset_index(names='date').melt(
+            id_vars='date', var_name='series_name', value_name='value'
+        )
+        long['series_id'] = np.repeat(_SERIES_MAP[df.columns].to_numpy(), len(df))
+        long['data_type'] = 'treasury'
+        # Round in float64 so float32 input does not reintroduce artifacts
+        values = long['value'].astype(np.float64).round(config.RAW_VALUE_DECIMALS)
+        long['value'] = values.astype(object).where(values.notna(), None)
+
+        records = long[['series_id', 'series_name', 'data_type', 'date', 'value']].to_dict('records')
+
+        upsert_raw_yield_data(self.db, records)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        records_stored = len(records)
         logger.info(f"Stored {records_stored} Treasury data records")
 
         return records_stored
@@ -100,62 +224,37 @@ class TreasuryCurveBuilder:
         ).all()
 
         if not raw_data:
-            logger.debug(f"No Treasury data found for {curve_date}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No Treasury data found for %s", curve_date)
             return None
 
-        # Extract maturities and yields
-        maturities = []
-        yields = []
-
-        for record in raw_data:
-            tenor = record.series_name
-            if tenor in config.TREASURY_MATURITIES and record.value is not None:
-                maturities.append(config.TREASURY_MATURITIES[tenor])
-                yields.append(record.value)
-
-        # Validate data
-        is_valid, error_msg = validate_curve_data(
-            maturities,
-            yields,
-            min_points=config.MIN_DATA_POINTS
+        # Extract yields in tenor order
+        values = {
+            record.series_name: record.value
+            for record in raw_data
+            if record.value is not None
+        }
+        yields_arr = np.array(
+            [values.get(tenor, np.nan) for tenor in config.TREASURY_TENORS],
+            dtype=np.float64
         )
 
-        if not is_valid:
-            logger.debug(f"Skipping {curve_date}: {error_msg}")
-            return None
+        return self.build_curve_from_arrays(curve_date, yields_arr)
 
-        try:
-            # Bootstrap the curve
-            zero_rates, discount_factors, forward_rates = self.bootstrapper.bootstrap_zero_curve(
-                maturities,
-                yields
-            )
-
-            # Interpolate to daily granularity
-            interpolated_maturities, interpolated_yields = self.bootstrapper.interpolate_curve(
-                maturities,
-                zero_rates
-            )
-
-            # Prepare curve data
-            curve_data = {
-                'curve_type': 'treasury',
-                'curve_date': curve_date,
-                'maturities': maturities,
-                'yields': yields,
-                'interpolated_maturities': interpolated_maturities.tolist(),
-                'interpolated_yields': interpolated_yields.tolist(),
-                'discount_factors': discount_factors.tolist(),
-                'forward_rates': forward_rates.tolist(),
-            }
-
-            logger.debug(f"Built Treasury curve for {curve_date} with {len(maturities)} points")
-
-            return curve_data
+    def build_curve_from_arrays(self, curve_date: date, yields_arr: np.ndarray) -> Optional[Dict]:
+        """
+        Build bootstrapped yield curve from already-loaded tenor yields.
 
-        except Exception as e:
-            logger.error(f"Failed to build curve for {curve_date}: {str(e)}")
-            return None
+        Args:
+            curve_date: Date of the curve
+            yields_arr: Yields ordered like config.TREASURY_TENORS, NaN where missing
+
+        Returns:
+            Dictionary containing curve data or None if insufficient data
+        """
+        return _log_curve_result(
+            _bootstrap_treasury_curve(self.bootstrapper, curve_date, yields_arr)
+        )
 
     def store_curve(self, curve_data: Dict) -> bool:
         """
@@ -168,42 +267,11 @@ class TreasuryCurveBuilder:
             True if successful
         """
         try:
-            # Check if curve already exists
-            existing = self.db.query(BootstrappedCurve).filter_by(
-                curve_type=curve_data['curve_type'],
-                curve_date=curve_data['curve_date']
-            ).first()
-
-            if existing:
-                # Update existing curve
-                existing.maturities = curve_data['maturities']
-                existing.yields = curve_data['yields']
-                existing.discount_factors = curve_data.get('discount_factors')
-                existing.forward_rates = curve_data.get('forward_rates')
-                existing.curve_metadata = {
-                    'interpolated_maturities': curve_data.get('interpolated_maturities'),
-                    'interpolated_yields': curve_data.get('interpolated_yields'),
-                    'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD,
-                }
-            else:
-                # Create new curve
-                curve = BootstrappedCurve(
-                    curve_type=curve_data['curve_type'],
-                    curve_date=curve_data['curve_date'],
-                    maturities=curve_data['maturities'],
-                    yields=curve_data['yields'],
-                    discount_factors=curve_data.get('discount_factors'),
-                    forward_rates=curve_data.get('forward_rates'),
-                    curve_metadata={
-                        'interpolated_maturities': curve_data.get('interpolated_maturities'),
-                        'interpolated_yields': curve_data.get('interpolated_yields'),
-                        'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD,
-                    }
-                )
-                self.db.add(curve)
-
+            upsert_bootstrapped_curves(self.db, [self._curve_row(curve_data)])
             self.db.commit()
-            logger.debug(f"Stored Treasury curve for {curve_data['curve_date']}")
+            _curve_cache.clear()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored Treasury curve for %s", curve_data['curve_date'])
             return True
 
         except Exception as e:
@@ -211,10 +279,86 @@ class TreasuryCurveBuilder:
             self.db.rollback()
             return False
 
+    def _curve_row(self, curve_data: Dict) -> Dict:
+        """
+        Convert built curve data to BootstrappedCurve column values.
+
+        Args:
+            curve_data: Curve data dictionary
+
+        Returns:
+            Row dictionary for upsert_bootstrapped_curves
+        """
+        # Kept as raw float64 bytes rather than a JSON list
+        discount_factors = curve_data.get('discount_factors')
+        discount_factors_blob = (
+            np.asarray(discount_factors, dtype=np.float64).tobytes()
+            if discount_factors is not None else None
+        )
+
+        # Dense curve stays an array until it is written out as JSON
+        interpolated_maturities = curve_data.get('interpolated_maturities')
+        interpolated_yields = curve_data.get('interpolated_yields')
+        if interpolated_maturities is not None:
+            interpolated_maturities = np.asarray(interpolated_maturities, dtype=np.float64)
+            interpolated_yields = np.asarray(interpolated_yields, dtype=np.float64)
+
+        return {
+            'curve_type': curve_data['curve_type'],
+            'curve_date': curve_data['curve_date'],
+            'maturities': curve_data['maturities'],
+            'yields': curve_data['yields'],
+            'discount_factors': None,
+            'discount_factors_blob': discount_factors_blob,
+            'forward_rates': curve_data.get('forward_rates'),
+            'curve_metadata': {
+                'interpolated_maturities': (
+                    interpolated_maturities.tolist() if interpolated_maturities is not None else None
+                ),
+                'interpolated_yields': (
+                    interpolated_yields.tolist() if interpolated_yields is not None else None
+                ),
+                'interpolation_method': config.BOOTSTRAPPING_INTERPOLATION_METHOD,
+            },
+            # Downsample once here so reads with a common max_points skip it
+            'downsampled_curves': precompute_downsampled_curves(
+                interpolated_maturities,
+                interpolated_yields,
+                config.CURVE_DOWNSAMPLE_SIZES
+            ),
+        }
+
+    def _store_curve_rows(self, curve_rows: List[Dict], commit: bool = True) -> bool:
+        """
+        Upsert and commit one chunk of built curves.
+
+        Args:
+            curve_rows: Rows for upsert_bootstrapped_curves
+            commit: Commit the chunk; if False it is only flushed and a failed
+                upsert is raised for the caller to roll back
+
+        Returns:
+            True if stored, False if the chunk was rolled back
+        """
+        try:
+            upsert_bootstrapped_curves(self.db, curve_rows)
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+            return True
+        except Exception as e:
+            if not commit:
+                raise
+            logger.error(f"Failed to store Treasury curves: {str(e)}")
+            self.db.rollback()
+            return False
+
     def build_curves_for_date_range(
         self,
         start_date: date,
-        end_date: date
+        end_date: date,
+        commit: bool = True
     ) -> Tuple[int, int]:
         """
         Build curves for a date range.
@@ -222,30 +366,55 @@ class TreasuryCurveBuilder:
         Args:
             start_date: Start date
             end_date: End date
+            commit: Commit each chunk of curves; if False they are only
+                flushed, for callers that commit them together with the raw
+                data they were built from, and a failed upsert raises
 
         Returns:
             Tuple of (successful_count, failed_count)
         """
         logger.info(f"Building Treasury curves from {start_date} to {end_date}")
 
-        # Get all unique dates with data
-        dates = self.db.query(RawYieldData.date).filter(
+        # Read the whole range at once and pivot to one row of tenor yields
+        # per date, rather than querying each date separately
+        rows = self.db.query(
+            RawYieldData.date,
+            RawYieldData.series_name,
+            RawYieldData.value
+        ).filter(
             RawYieldData.data_type == 'treasury',
             RawYieldData.date >= start_date,
             RawYieldData.date <= end_date
-        ).distinct().order_by(RawYieldData.date).all()
-
-        unique_dates = [d[0] for d in dates]
+        ).all()
 
         successful = 0
         failed = 0
 
-        for curve_date in unique_dates:
-            curve_data = self.build_curve(curve_date)
-            if curve_data and self.store_curve(curve_data):
-                successful += 1
+        if not rows:
+            logger.info("Built Treasury curves: 0 successful, 0 failed")
+            return successful, failed
+
+        tenor_matrix = pd.DataFrame(
+            rows, columns=['date', 'series_name', 'value']
+        ).pivot(index='date', columns='series_name', values='value').sort_index()
+        yields_matrix = tenor_matrix.reindex(
+            columns=list(config.TREASURY_TENORS)
+        ).to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Store each chunk of built curves as it comes back, so a long
+        # range never holds more than two chunks of dense curves in memory
+        # and, when committing per chunk, a failed upsert only loses its own
+        tasks = list(zip(tenor_matrix.index, yields_matrix))
+        for built_curves in self._build_curve_chunks(tasks):
+            curve_rows = [self._curve_row(curve_data) for curve_data in built_curves if curve_data]
+            failed += len(built_curves) - len(curve_rows)
+            if self._store_curve_rows(curve_rows, commit):
+                successful += len(curve_rows)
             else:
-                failed += 1
+                failed += len(curve_rows)
+
+        if successful:
+            _curve_cache.clear()
 
         logger.info(
             f"Built Treasury curves: {successful} successful, {failed} failed"
@@ -253,10 +422,171 @@ class TreasuryCurveBuilder:
 
         return successful, failed
 
+    def _build_curve_chunks(
+        self,
+        tasks: List[Tuple[date, np.ndarray]]
+    ) -> Iterator[List[Optional[Dict]]]:
+        """
+        Build curves config.CURVE_UPSERT_CHUNK_SIZE dates at a time.
+
+        Each date bootstraps independently, so long ranges are spread across
+        worker processes. Workers are spawned rather than forked: the
+        scheduler process runs APScheduler, executor and logging threads
+        whose locks a forked child could inherit mid-acquire. The next chunk
+        is submitted to the pool before the current one is yielded, so the
+        workers keep building while the caller stores.
+
+        Args:
+            tasks: Tuples of (curve_date, yields ordered like config.TREASURY_TENORS)
+
+        Yields:
+            Curve data dictionaries, or None for dates that could not be built
+        """
+        size = config.CURVE_UPSERT_CHUNK_SIZE
+        chunks = [tasks[start:start + size] for start in range(0, len(tasks), size)]
+
+        if config.CURVE_BUILD_WORKERS <= 1 or len(tasks) < config.CURVE_BUILD_PARALLEL_MIN_DATES:
+            for chunk in chunks:
+                yield [self.build_curve_from_arrays(curve_date, yields_arr) for curve_date, yields_arr in chunk]
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=config.CURVE_BUILD_WORKERS,
+            mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            pending = None
+            for chunk in chunks:
+                results = executor.map(
+                    _build_curve_worker, chunk, chunksize=config.CURVE_BUILD_CHUNK_SIZE
+                )
+                if pending is not None:
+                    yield [_log_curve_result(result) for result in pending]
+                pending = results
+            if pending is not None:
+                yield [_log_curve_result(result) for result in pending]
+
+    def store_monthly_blocks(self, start_date: date, end_date: date, commit: bool = True) -> int:
+        """
+        Rebuild the packed monthly tenor blocks covering a date range.
+
+        Each block holds one calendar month of standard-tenor yields as an
+        int16 basis-point matrix (one row per date, one column per
+        config.TREASURY_TENORS entry), so range reads load a few small rows
+        instead of thousands. Missing observations are stored as MISSING_BP.
+
+        Args:
+            start_date: First date to cover (its whole month is rebuilt)
+            end_date: Last date to cover (its whole month is rebuilt)
+            commit: Commit the blocks; if False they are only flushed
+
+        Returns:
+            Number of monthly blocks written
+        """
+        first_day = start_date.replace(day=1)
+        after_last_day = (end_date.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+        rows = self.db.query(
+            RawYieldData.date,
+            RawYieldData.series_name,
+            RawYieldData.value
+        ).filter(
+            RawYieldData.data_type == 'treasury',
+            RawYieldData.date >= first_day,
+            RawYieldData.date < after_last_day
+        ).all()
+
+        if not rows:
+            return 0
+
+        matrix = pd.DataFrame(rows, columns=['date', 'tenor', 'value']).pivot(
+            index='date', columns='tenor', values='value'
+        ).reindex(columns=list(config.TREASURY_TENORS)).sort_index()
+
+        month_keys = np.array([d.year * 100 + d.month for d in matrix.index])
+        ordinals = np.array([d.toordinal() for d in matrix.index], dtype=np.int32)
+        values = matrix.to_numpy(dtype=np.float64, na_value=np.nan)
+        values_bp = np.where(
+            np.isnan(values),
+            MISSING_BP,
+            np.rint(np.nan_to_num(values) * 100.0)
+        ).astype(np.int16)
+
+        blocks_written = 0
+        for month in np.unique(month_keys):
+            in_month = month_keys == month
+            self.db.merge(TreasuryCurveBlock(
+                month=int(month),
+                dates=ordinals[in_month].tobytes(),
+                yields=np.ascontiguousarray(values_bp[in_month]).tobytes(),
+            ))
+            blocks_written += 1
+
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        logger.info(f"Stored {blocks_written} monthly Treasury blocks")
+
+        return blocks_written
+
+    def get_tenor_matrix(self, start_date: date, end_date: date) -> Tuple[List[date], np.ndarray]:
+        """
+        Read standard-tenor Treasury yields for a date range from the monthly blocks.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            Tuple of (dates, yields) where yields is a float32 percentage matrix
+            with one row per date and one column per config.TREASURY_TENORS
+            entry (NaN where missing)
+        """
+        blocks = self.db.query(TreasuryCurveBlock).filter(
+            TreasuryCurveBlock.month >= start_date.year * 100 + start_date.month,
+            TreasuryCurveBlock.month <= end_date.year * 100 + end_date.month
+        ).order_by(TreasuryCurveBlock.month).all()
+
+        n_tenors = len(config.TREASURY_TENORS)
+        if not blocks:
+            return [], np.empty((0, n_tenors), dtype=np.float32)
+
+        ordinals = np.concatenate([np.frombuffer(b.dates, dtype=np.int32) for b in blocks])
+        yields_bp = np.concatenate([
+            np.frombuffer(b.yields, dtype=np.int16).reshape(-1, n_tenors) for b in blocks
+        ])
+
+        in_range = (ordinals >= start_date.toordinal()) & (ordinals <= end_date.toordinal())
+        dates = [date.fromordinal(int(o)) for o in ordinals[in_range]]
+
+        yields_bp = yields_bp[in_range]
+        yields = yields_bp.astype(np.float32) * np.float32(0.01)
+        yields[yields_bp == MISSING_BP] = np.nan
+
+        return dates, yields
+
     def get_curve(self, curve_date: date, max_points: Optional[int] = None) -> Optional[Dict]:
         """
         Retrieve stored curve for a specific date.
 
+        Args:
+            curve_date: Date of the curve
+            max_points: Maximum number of interpolated points to return (for performance)
+
+        Returns:
+            Curve data dictionary or None. The dictionary is memoized and
+            shared between callers, so it must not be modified.
+        """
+        return _curve_cache.get_or_compute(
+            (curve_date, max_points),
+            lambda: self._load_curve(curve_date, max_points),
+            config.RESPONSE_CACHE_TTL
+        )
+
+    def _load_curve(self, curve_date: date, max_points: Optional[int] = None) -> Optional[Dict]:
+        """
+        Load a stored curve for a specific date from the database.
+
         Args:
             curve_date: Date of the curve
             max_points: Maximum number of interpolated points to return (for performance)
@@ -264,48 +594,118 @@ class TreasuryCurveBuilder:
         Returns:
             Curve data dictionary or None
         """
-        curve = self.db.query(BootstrappedCurve).filter_by(
+        query = self.db.query(BootstrappedCurve).filter_by(
             curve_type='treasury',
             curve_date=curve_date
-        ).first()
+        )
+        if max_points in config.CURVE_DOWNSAMPLE_SIZES:
+            # Served from downsampled_curves; skip decoding the dense curve
+            query = query.options(defer(BootstrappedCurve.curve_metadata))
+        curve = query.first()
 
         if not curve:
             return None
 
-        # Use interpolated curves if available, otherwise use original
-        interpolated_maturities = curve.curve_metadata.get('interpolated_maturities') if curve.curve_metadata else None
-        interpolated_yields = curve.curve_metadata.get('interpolated_yields') if curve.curve_metadata else None
+        return self._curve_to_dict(curve, max_points)
+
+    def build_curves_bulk(
+        self,
+        curves: List[BootstrappedCurve],
+        max_points: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Build curve dictionaries from already-loaded rows.
+
+        Lets callers fetch many curves with one query instead of calling
+        get_curve once per date.
+
+        Args:
+            curves: Loaded Treasury curve rows
+            max_points: Maximum number of interpolated points per curve
+
+        Returns:
+            List of curve data dictionaries, in input order
+        """
+        return [self._curve_to_dict(curve, max_points) for curve in curves]
+
+    def _curve_to_dict(self, curve: BootstrappedCurve, max_points: Optional[int] = None) -> Dict:
+        """
+        Convert a stored curve row to its API dictionary.
+
+        Args:
+            curve: Stored curve row
+            max_points: Maximum number of interpolated points to return
+
+        Returns:
+            Curve data dictionary
+        """
+        precomputed = (curve.downsampled_curves or {}).get(str(max_points)) if max_points else None
+
+        if precomputed:
+            interpolated_maturities = precomputed['maturities']
+            interpolated_yields = precomputed['yields']
+        else:
+            # Use interpolated curves if available, otherwise use original
+            interpolated_maturities = curve.curve_metadata.get('interpolated_maturities') if curve.curve_metadata else None
+            interpolated_yields = curve.curve_metadata.get('interpolated_yields') if curve.curve_metadata else None
+
+            # Downsample if requested
+            if interpolated_maturities:
+                interpolated_maturities, interpolated_yields = downsample_curve(
+                    interpolated_maturities, interpolated_yields, max_points
+                )
 
-        # Downsample if requested
-        if max_points and interpolated_maturities and len(interpolated_maturities) > max_points:
-            import numpy as np
-            indices = np.linspace(0, len(interpolated_maturities) - 1, max_points, dtype=int)
-            interpolated_maturities = [interpolated_maturities[i] for i in indices]
-            interpolated_yields = [interpolated_yields[i] for i in indices]
+        if curve.discount_factors_blob is not None:
+            discount_factors = np.frombuffer(curve.discount_factors_blob, dtype=np.float64).tolist()
+        else:
+            discount_factors = curve.discount_factors
 
         return {
             'curve_type': curve.curve_type,
             'curve_date': curve.curve_date.isoformat(),
             'maturities': interpolated_maturities if interpolated_maturities else curve.maturities,
             'yields': interpolated_yields if interpolated_yields else curve.yields,
-            'discount_factors': curve.discount_factors,
+            'discount_factors': discount_factors,
             'forward_rates': curve.forward_rates,
             'original_maturities': curve.maturities,  # Keep original sparse points
             'original_yields': curve.yields,
         }
 
-    def get_latest_curve(self) -> Optional[Dict]:
+    def get_latest_curve(self, max_points: Optional[int] = None) -> Optional[Dict]:
         """
         Get the most recent Treasury curve.
 
+        Args:
+            max_points: Maximum number of interpolated points to return (for performance)
+
+        Returns:
+            Latest curve data or None. The dictionary is memoized and shared
+            between callers, so it must not be modified.
+        """
+        return _curve_cache.get_or_compute(
+            ('latest', max_points),
+            lambda: self._load_latest_curve(max_points),
+            config.RESPONSE_CACHE_LATEST_TTL
+        )
+
+    def _load_latest_curve(self, max_points: Optional[int] = None) -> Optional[Dict]:
+        """
+        Load the most recent Treasury curve from the database.
+
+        Args:
+            max_points: Maximum number of interpolated points to return (for performance)
+
         Returns:
             Latest curve data or None
         """
-        curve = self.db.query(BootstrappedCurve).filter_by(
+        query = self.db.query(BootstrappedCurve).filter_by(
             curve_type='treasury'
-        ).order_by(BootstrappedCurve.curve_date.desc()).first()
+        ).order_by(BootstrappedCurve.curve_date.desc())
+        if max_points in config.CURVE_DOWNSAMPLE_SIZES:
+            query = query.options(defer(BootstrappedCurve.curve_metadata))
+        curve = query.first()
 
         if not curve:
             return None
 
-        return self.get_curve(curve.curve_date)
+        return self._curve_to_dict(curve, max_points)
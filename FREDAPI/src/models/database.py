@@ -1,16 +1,56 @@
 """
 Database models for storing yield curve data.
 """
-from datetime import datetime
-from typing import Optional
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Date, JSON, UniqueConstraint
+from array import array
+import csv
+import io
+import json
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import create_engine, event, func, inspect, text, Column, Integer, String, Float, DateTime, Date, JSON, LargeBinary, Index, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.types import TypeDecorator
 import config
 
 Base = declarative_base()
 
 
+class FloatArray(TypeDecorator):
+    """
+    List of floats stored as a typed vector instead of JSON text.
+
+    PostgreSQL gets a native double precision[] column; other databases
+    store the packed float64 bytes. Rows written as JSON before this type
+    existed are still decoded.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(ARRAY(Float))
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if dialect.name == 'postgresql':
+            return [float(v) for v in value]
+        return array('d', value).tobytes()
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, list):
+            return value
+        if isinstance(value, str):
+            return json.loads(value)
+        vector = array('d')
+        vector.frombytes(value)
+        return vector.tolist()
+
+
 class RawYieldData(Base):
     """Raw yield data from FRED API."""
     __tablename__ = "raw_yield_data"
@@ -21,11 +61,19 @@ class RawYieldData(Base):
     data_type = Column(String(20), nullable=False)  # 'treasury' or 'corporate'
     date = Column(Date, nullable=False, index=True)
     value = Column(Float, nullable=True)  # Can be null for missing data
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamps are set by the database (CURRENT_TIMESTAMP, UTC on SQLite) rather than
+    # per row in Python; default= also covers tables created before server_default
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     __table_args__ = (
         UniqueConstraint('series_id', 'date', name='uix_series_date'),
+        # Serves the /raw lookups (type + name, newest first) from the index
+        # alone: series_id and value ride along so no table row is read
+        Index('ix_raw_yield_covering', 'data_type', 'series_name', 'date', 'series_id', 'value'),
+        # Serves the curve builders' per-date and date-range reads
+        # (type + date window, all series) with one index range scan
+        Index('ix_raw_yield_type_date', 'data_type', 'date', 'series_name', 'value'),
     )
 
 
@@ -36,18 +84,30 @@ class BootstrappedCurve(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     curve_type = Column(String(20), nullable=False, index=True)  # 'treasury' or 'corporate'
     curve_date = Column(Date, nullable=False, index=True)
-    maturities = Column(JSON, nullable=False)  # List of maturities in years
-    yields = Column(JSON, nullable=False)  # List of corresponding yields
-    discount_factors = Column(JSON, nullable=True)  # Optional discount factors
-    forward_rates = Column(JSON, nullable=True)  # Optional forward rates
+    maturities = Column(FloatArray, nullable=False)  # List of maturities in years
+    yields = Column(FloatArray, nullable=False)  # List of corresponding yields
+    discount_factors = Column(JSON, nullable=True)  # Legacy rows; newer rows use discount_factors_blob
+    discount_factors_blob = Column(LargeBinary, nullable=True)  # float64 discount factors, one per maturity
+    forward_rates = Column(FloatArray, nullable=True)  # Optional forward rates
     curve_metadata = Column(JSON, nullable=True)  # Additional metadata (interpolation method, etc.)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    downsampled_curves = Column(JSON, nullable=True)  # {str(max_points): {'maturities', 'yields'}}
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint('curve_type', 'curve_date', name='uix_curve_type_date'),
     )
 
 
+class TreasuryCurveBlock(Base):
+    """Standard-tenor Treasury yields packed per calendar month."""
+    __tablename__ = "treasury_curve_blocks"
+
+    month = Column(Integer, primary_key=True)  # YYYYMM
+    dates = Column(LargeBinary, nullable=False)  # int32 date ordinals, one per row
+    yields = Column(LargeBinary, nullable=False)  # int16 basis points (n_dates, n_tenors)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
+
+
 class CorporateSpreadCurve(Base):
     """Corporate spread curves over treasuries."""
     __tablename__ = "corporate_spread_curves"
@@ -55,11 +115,11 @@ class CorporateSpreadCurve(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     rating = Column(String(20), nullable=False, index=True)  # AAA, BAA, etc.
     curve_date = Column(Date, nullable=False, index=True)
-    maturities = Column(JSON, nullable=False)  # List of maturities in years
-    spreads = Column(JSON, nullable=False)  # List of spreads over treasuries
-    yields = Column(JSON, nullable=False)  # Absolute yields (treasury + spread)
+    maturities = Column(FloatArray, nullable=False)  # List of maturities in years
+    spreads = Column(FloatArray, nullable=False)  # List of spreads over treasuries
+    yields = Column(FloatArray, nullable=False)  # Absolute yields (treasury + spread)
     curve_metadata = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint('rating', 'curve_date', name='uix_rating_curve_date'),
@@ -73,23 +133,299 @@ class DataUpdateLog(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     update_type = Column(String(50), nullable=False)  # 'full_refresh', 'incremental', etc.
     status = Column(String(20), nullable=False)  # 'success', 'failed', 'partial'
-    start_time = Column(DateTime, nullable=False)
-    end_time = Column(DateTime, nullable=True)
+    start_time = Column(DateTime(timezone=True), nullable=False)  # UTC
+    end_time = Column(DateTime(timezone=True), nullable=True)
     records_processed = Column(Integer, default=0)
     records_updated = Column(Integer, default=0)
     records_failed = Column(Integer, default=0)
     error_message = Column(String(500), nullable=True)
-    log_metadata = Column(JSON, nullable=True)
+    error_traceback = Column(Text, nullable=True)
+    # Key-level changes to the dict mark the column dirty
+    log_metadata = Column(MutableDict.as_mutable(JSON), nullable=True)
+
+
+def _engine_options(database_url: str) -> Dict:
+    """
+    Driver-specific create_engine() options for fast executemany and pooling.
+
+    Bulk upserts are executed as executemany; these options make each
+    driver send them as large multi-row batches instead of one statement
+    per row. The pool is sized for concurrent API requests and range
+    builds, and reuses the most recently returned connection first.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments for create_engine()
+    """
+    options = {'insertmanyvalues_page_size': config.DATABASE_INSERT_PAGE_SIZE}
+
+    url = make_url(database_url)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        # In-memory SQLite uses a single-connection pool with no size settings
+        return options
+
+    options.update(
+        pool_size=config.DATABASE_POOL_SIZE,
+        max_overflow=config.DATABASE_MAX_OVERFLOW,
+        pool_use_lifo=True,
+    )
+    if url.get_backend_name() != 'sqlite':
+        # Server connections can be dropped while idle; a local file cannot
+        options.update(pool_pre_ping=True, pool_recycle=config.DATABASE_POOL_RECYCLE)
+
+    if url.get_driver_name() == 'psycopg2':
+        options['executemany_mode'] = 'values_plus_batch'
+        options['executemany_batch_page_size'] = config.DATABASE_BATCH_PAGE_SIZE
+    elif url.get_driver_name() == 'pyodbc':
+        options['fast_executemany'] = True
+
+    return options
 
 
 # Database engine and session
-engine = create_engine(config.DATABASE_URL, echo=False)
+engine = create_engine(config.DATABASE_URL, echo=False, **_engine_options(config.DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply config.SQLITE_PRAGMAS to each new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for pragma in config.SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
 def init_database():
     """Initialize the database by creating all tables."""
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    _create_missing_indexes()
+
+
+def _add_missing_columns():
+    """
+    Add nullable columns introduced after a table was first created.
+
+    create_all() only creates missing tables, so databases from earlier
+    versions are brought up to date column by column.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(
+                    f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+                ))
+
+
+def _create_missing_indexes():
+    """
+    Create indexes added after a table was first created.
+
+    create_all() skips existing tables together with their indexes.
+    """
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+
+
+def _dialect_insert(db: Session):
+    """
+    Return the insert() construct with ON CONFLICT support for the session's dialect.
+
+    Args:
+        db: Database session
+
+    Returns:
+        sqlite or postgresql insert function
+
+    Raises:
+        ValueError: If the database dialect has no ON CONFLICT support here
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        raise ValueError(f"Bulk upsert is not supported for the {dialect} dialect")
+    return insert
+
+
+def _replace_rows(
+    db: Session,
+    table,
+    key_columns: Tuple[str, ...],
+    rows: List[Dict],
+    chunk_size: int
+) -> None:
+    """
+    Insert rows, overwriting every non-key column of existing rows with the same key.
+
+    Args:
+        db: Database session
+        table: Target table
+        key_columns: Columns of the unique constraint to upsert on
+        rows: Dicts of column values, all with the same keys
+        chunk_size: Rows per INSERT ... ON CONFLICT statement
+    """
+    if not rows:
+        return
+
+    stmt = _dialect_insert(db)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key_columns),
+        set_={
+            name: stmt.excluded[name]
+            for name in rows[0]
+            if name not in key_columns
+        }
+    )
+
+    for start in range(0, len(rows), chunk_size):
+        db.execute(stmt, rows[start:start + chunk_size])
+
+
+def upsert_raw_yield_data(db: Session, records: List[Dict]) -> None:
+    """
+    Insert or update raw observations in bulk, keyed on (series_id, date).
+
+    Replaces a SELECT plus INSERT/UPDATE per observation with one
+    INSERT ... ON CONFLICT DO UPDATE per chunk of config.RAW_UPSERT_CHUNK_SIZE
+    rows; on PostgreSQL with psycopg2, batches of at least
+    config.RAW_COPY_MIN_ROWS are streamed with COPY instead. A missing (None)
+    value never overwrites a stored one. The caller commits.
+
+    Args:
+        db: Database session
+        records: Dicts with series_id, series_name, data_type, date and value
+
+    Raises:
+        ValueError: If the database dialect has no ON CONFLICT support here
+    """
+    if not records:
+        return
+
+    bind = db.get_bind()
+    if (
+        bind.dialect.name == 'postgresql'
+        and bind.dialect.driver == 'psycopg2'
+        and len(records) >= config.RAW_COPY_MIN_ROWS
+    ):
+        _copy_upsert_raw_yield_data(db, records)
+        return
+
+    table = RawYieldData.__table__
+    stmt = _dialect_insert(db)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['series_id', 'date'],
+        set_={
+            'value': func.coalesce(stmt.excluded.value, table.c.value),
+            'updated_at': func.now(),
+        }
+    )
+
+    chunk_size = config.RAW_UPSERT_CHUNK_SIZE
+    for start in range(0, len(records), chunk_size):
+        db.execute(stmt, records[start:start + chunk_size])
+
+
+def _copy_upsert_raw_yield_data(db: Session, records: List[Dict]) -> None:
+    """
+    Upsert raw observations on PostgreSQL by streaming them with COPY.
+
+    COPY cannot resolve conflicts itself, so the rows are copied into a
+    session-scoped temporary staging table and merged with a single
+    INSERT ... SELECT ... ON CONFLICT DO UPDATE, with the same semantics as
+    upsert_raw_yield_data.
+
+    Args:
+        db: Database session on a psycopg2 connection
+        records: Dicts with series_id, series_name, data_type, date and value
+    """
+    columns = ('series_id', 'series_name', 'data_type', 'date', 'value')
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # An empty unquoted field is NULL in COPY's CSV format
+    writer.writerows(
+        tuple('' if record[name] is None else record[name] for name in columns)
+        for record in records
+    )
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(
+            "CREATE TEMPORARY TABLE IF NOT EXISTS raw_yield_staging ("
+            "series_id varchar(50), series_name varchar(100), data_type varchar(20), "
+            "date date, value double precision"
+            ") ON COMMIT DELETE ROWS"
+        )
+        cursor.execute("TRUNCATE raw_yield_staging")
+        cursor.copy_expert(
+            f"COPY raw_yield_staging ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+        cursor.execute(
+            f"INSERT INTO raw_yield_data ({', '.join(columns)}, created_at, updated_at) "
+            f"SELECT {', '.join(columns)}, now(), now() FROM raw_yield_staging "
+            "ON CONFLICT (series_id, date) DO UPDATE SET "
+            "value = COALESCE(EXCLUDED.value, raw_yield_data.value), updated_at = now()"
+        )
+    finally:
+        cursor.close()
+
+
+def upsert_bootstrapped_curves(db: Session, rows: List[Dict]) -> None:
+    """
+    Insert or replace bootstrapped curves in bulk, keyed on (curve_type, curve_date).
+
+    One INSERT ... ON CONFLICT DO UPDATE per chunk of
+    config.CURVE_UPSERT_CHUNK_SIZE curves replaces the existence SELECT
+    followed by an INSERT or UPDATE for every curve. The caller commits.
+
+    Args:
+        db: Database session
+        rows: Dicts of BootstrappedCurve column values, all with the same keys
+
+    Raises:
+        ValueError: If the database dialect has no ON CONFLICT support here
+    """
+    _replace_rows(
+        db, BootstrappedCurve.__table__, ('curve_type', 'curve_date'),
+        rows, config.CURVE_UPSERT_CHUNK_SIZE
+    )
+
+
+def upsert_spread_curves(db: Session, rows: List[Dict]) -> None:
+    """
+    Insert or replace corporate spread curves in bulk, keyed on (rating, curve_date).
+
+    The caller commits.
+
+    Args:
+        db: Database session
+        rows: Dicts of CorporateSpreadCurve column values, all with the same keys
+
+    Raises:
+        ValueError: If the database dialect has no ON CONFLICT support here
+    """
+    _replace_rows(
+        db, CorporateSpreadCurve.__table__, ('rating', 'curve_date'),
+        rows, config.CURVE_UPSERT_CHUNK_SIZE
+    )
 
 
 def get_db():
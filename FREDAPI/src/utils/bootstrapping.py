@@ -1,14 +1,92 @@
 """
 Bootstrapping algorithm for yield curve construction.
 """
-from typing import List, Tuple, Dict, Optional
+from array import array
+from bisect import bisect_right
+from typing import List, Tuple, Dict, Optional, Union
 import numpy as np
-from scipy.interpolate import CubicSpline, interp1d
+from scipy.interpolate import CubicSpline, PPoly, PchipInterpolator, make_interp_spline
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
+def _discount_and_forward_loop(
+    maturities: np.ndarray,
+    zero_rates: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Discount factors and forward rates in one scalar loop.
+
+    Same arithmetic as the NumPy path in bootstrap_zero_curve and
+    _calculate_forward_rates; only used when numba compiles it, since
+    curves have a few dozen points at most and NumPy's per-call dispatch
+    then costs more than the math.
+
+    Args:
+        maturities: Sorted maturities in years (at least 2)
+        zero_rates: Zero rates in percent
+
+    Returns:
+        Tuple of (discount_factors, forward_rates)
+    """
+    n = maturities.shape[0]
+    discount_factors = np.empty(n)
+    forward_rates = np.empty(n)
+
+    for i in range(n):
+        discount_factors[i] = np.exp(-zero_rates[i] / 100.0 * maturities[i])
+
+    forward_rates[0] = zero_rates[0]
+    for i in range(1, n):
+        step = maturities[i] - maturities[i - 1]
+        if step > 0:
+            growth = zero_rates[i] / 100.0 * maturities[i] - zero_rates[i - 1] / 100.0 * maturities[i - 1]
+            forward_rates[i] = growth / step * 100.0
+        else:
+            forward_rates[i] = zero_rates[i]
+
+    return discount_factors, forward_rates
+
+
+_jit_discount_and_forward = (
+    njit(cache=True)(_discount_and_forward_loop) if njit is not None else None
+)
+
+
+def build_interpolator(
+    maturities: np.ndarray,
+    rates: np.ndarray,
+    method: str
+):
+    """
+    Fit the interpolator for a set of curve points.
+
+    Args:
+        maturities: Sorted maturities without NaNs
+        rates: Corresponding rates
+        method: Interpolation method ('pchip', 'cubic', 'quadratic', 'linear')
+
+    Returns:
+        Callable scipy interpolator
+    """
+    x = np.asarray(maturities, dtype=np.float64)
+    y = np.asarray(rates, dtype=np.float64)
+
+    if method == "pchip":
+        return PchipInterpolator(x, y, extrapolate=False)
+    if method == "cubic" and len(x) >= 4:
+        return CubicSpline(x, y, extrapolate=False)
+    if method == "quadratic" and len(x) >= 3:
+        return make_interp_spline(x, y, k=2)
+    return make_interp_spline(x, y, k=1)
+
+
 class YieldCurveBootstrapper:
     """Bootstrap yield curves from market data."""
 
@@ -17,7 +95,7 @@ class YieldCurveBootstrapper:
         Initialize bootstrapper.
 
         Args:
-            interpolation_method: Interpolation method ('cubic', 'linear', 'quadratic')
+            interpolation_method: Interpolation method ('pchip', 'cubic', 'linear', 'quadratic')
         """
         self.interpolation_method = interpolation_method
 
@@ -59,13 +137,20 @@ class YieldCurveBootstrapper:
         # In a more sophisticated implementation, you would bootstrap from par yields
         zero_rates = yields.copy()
 
-        # Calculate discount factors
-        discount_factors = np.exp(-zero_rates / 100.0 * maturities)
+        if _jit_discount_and_forward is not None:
+            discount_factors, forward_rates = _jit_discount_and_forward(
+                np.ascontiguousarray(maturities, dtype=np.float64),
+                np.ascontiguousarray(zero_rates, dtype=np.float64)
+            )
+        else:
+            # Calculate discount factors
+            discount_factors = np.exp(-zero_rates / 100.0 * maturities)
 
-        # Calculate forward rates
-        forward_rates = self._calculate_forward_rates(maturities, zero_rates)
+            # Calculate forward rates
+            forward_rates = self._calculate_forward_rates(maturities, zero_rates)
 
-        logger.debug(f"Bootstrapped curve with {len(maturities)} points")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Bootstrapped curve with %d points", len(maturities))
 
         return zero_rates, discount_factors, forward_rates
 
@@ -87,8 +172,8 @@ class YieldCurveBootstrapper:
         Returns:
             Tuple of (interpolated_maturities, interpolated_rates)
         """
-        maturities = np.array(maturities)
-        rates = np.array(rates)
+        maturities = np.asarray(maturities, dtype=np.float64)
+        rates = np.asarray(rates, dtype=np.float64)
 
         # Remove NaN values
         valid_mask = ~(np.isnan(maturities) | np.isnan(rates))
@@ -114,23 +199,21 @@ class YieldCurveBootstrapper:
             target_maturities = np.array(target_maturities)
 
         # Perform interpolation
-        if self.interpolation_method == "cubic" and len(maturities) >= 4:
-            interpolator = CubicSpline(maturities, rates, extrapolate=False)
-        elif self.interpolation_method == "quadratic" and len(maturities) >= 3:
-            interpolator = interp1d(maturities, rates, kind='quadratic', fill_value='extrapolate')
-        else:
-            interpolator = interp1d(maturities, rates, kind='linear', fill_value='extrapolate')
-
+        interpolator = build_interpolator(maturities, rates, self.interpolation_method)
         interpolated_rates = interpolator(target_maturities)
 
-        # Clip to reasonable bounds (prevent negative rates unless they exist in original data)
-        min_rate = min(rates.min(), 0)  # Allow negative rates if present in data
-        max_rate = rates.max() * 1.5  # Allow some extrapolation
-        interpolated_rates = np.clip(interpolated_rates, min_rate, max_rate)
+        # PCHIP is shape-preserving and never overshoots the data; the other
+        # methods can, so clip them to reasonable bounds (prevent negative
+        # rates unless they exist in original data)
+        if self.interpolation_method != "pchip":
+            min_rate = min(rates.min(), 0)  # Allow negative rates if present in data
+            max_rate = rates.max() * 1.5  # Allow some extrapolation
+            interpolated_rates = np.clip(interpolated_rates, min_rate, max_rate)
 
-        logger.debug(
-            f"Interpolated curve from {len(maturities)} to {len(target_maturities)} points"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Interpolated curve from %d to %d points", len(maturities), len(target_maturities)
+            )
 
         return target_maturities, interpolated_rates
 
@@ -152,21 +235,22 @@ class YieldCurveBootstrapper:
         if len(maturities) < 2:
             return zero_rates.copy()
 
-        forward_rates = np.zeros_like(zero_rates)
-        forward_rates[0] = zero_rates[0]
+        t = np.asarray(maturities, dtype=np.float64)
+        r = np.asarray(zero_rates, dtype=np.float64) / 100.0
 
-        for i in range(1, len(maturities)):
-            t1 = maturities[i - 1]
-            t2 = maturities[i]
-            r1 = zero_rates[i - 1] / 100.0
-            r2 = zero_rates[i] / 100.0
+        # Forward rate over each interval; a non-increasing maturity step
+        # falls back to the zero rate at its end
+        growth = r[1:] * t[1:] - r[:-1] * t[:-1]
+        step = t[1:] - t[:-1]
+        increasing = step > 0
 
-            # Forward rate calculation
-            if t2 > t1:
-                forward_rate = ((r2 * t2 - r1 * t1) / (t2 - t1)) * 100.0
-                forward_rates[i] = forward_rate
-            else:
-                forward_rates[i] = zero_rates[i]
+        forward_rates = np.empty_like(r)
+        forward_rates[0] = zero_rates[0]
+        forward_rates[1:] = np.where(
+            increasing,
+            np.divide(growth, step, out=np.zeros_like(growth), where=increasing) * 100.0,
+            zero_rates[1:]
+        )
 
         return forward_rates
 
@@ -226,12 +310,140 @@ class YieldCurveBootstrapper:
         smoothed = rates.copy()
         half_window = window_size // 2
 
-        for i in range(half_window, len(rates) - half_window):
-            smoothed[i] = np.mean(rates[i - half_window:i + half_window + 1])
+        # Centred moving average in one C-level pass; the first and last
+        # half_window points keep their original values
+        if window_size <= len(rates):
+            kernel = np.full(window_size, 1.0 / window_size)
+            smoothed[half_window:len(rates) - half_window] = np.convolve(rates, kernel, mode='valid')
 
         return smoothed
 
 
+class ScalarSplineEvaluator:
+    """
+    Evaluate a fitted spline of degree 3 or less at one point with plain float arithmetic.
+
+    Calling a scipy spline on a scalar costs far more in argument handling
+    than the arithmetic itself. This keeps the spline's knots and per-segment
+    polynomial coefficients in flat double arrays, finds the segment with a C
+    bisect and evaluates it with Horner's rule. Points outside the knots
+    extrapolate from the end segments, like CubicSpline(extrapolate=True).
+    """
+
+    __slots__ = ('_knots', '_coeffs', '_last_segment')
+
+    def __init__(self, spline):
+        """
+        Initialize evaluator.
+
+        Args:
+            spline: Fitted 1-D interpolator from build_interpolator (a scipy
+                PPoly such as CubicSpline or PchipInterpolator, or a BSpline)
+        """
+        if not isinstance(spline, PPoly):
+            spline = PPoly.from_spline(spline)
+
+        # B-spline conversion repeats the end knots; drop the empty segments
+        keep = np.diff(spline.x) > 0
+        knots = np.append(spline.x[:-1][keep], spline.x[-1])
+        coeffs = spline.c[:, keep]
+
+        # Pad lower degrees with zero leading coefficients so every segment
+        # is evaluated as a cubic
+        if coeffs.shape[0] < 4:
+            coeffs = np.vstack([np.zeros((4 - coeffs.shape[0], coeffs.shape[1])), coeffs])
+
+        self._knots = array('d', knots)
+        # PPoly coefficients are (4, n_segments), highest power first; store
+        # them segment by segment so one segment's four values are adjacent
+        self._coeffs = array('d', np.ascontiguousarray(coeffs.T).ravel())
+        self._last_segment = len(self._knots) - 2
+
+    def __call__(self, t: float) -> float:
+        """
+        Evaluate the spline at t.
+
+        Args:
+            t: Point to evaluate (maturity in years)
+
+        Returns:
+            Spline value at t
+        """
+        knots = self._knots
+        segment = bisect_right(knots, t) - 1
+        if segment < 0:
+            segment = 0
+        elif segment > self._last_segment:
+            segment = self._last_segment
+
+        base = 4 * segment
+        coeffs = self._coeffs
+        dx = t - knots[segment]
+        return ((coeffs[base] * dx + coeffs[base + 1]) * dx + coeffs[base + 2]) * dx + coeffs[base + 3]
+
+
+def downsample_curve(
+    maturities: Union[List[float], np.ndarray],
+    yields: Union[List[float], np.ndarray],
+    max_points: Optional[int]
+) -> Tuple[List[float], List[float]]:
+    """
+    Select evenly spaced points from a dense curve, keeping both ends.
+
+    Args:
+        maturities: Dense maturities, as stored lists or freshly built arrays
+        yields: Corresponding yields
+        max_points: Number of points to keep. If None or not smaller than the
+                    curve, the curve is returned unchanged.
+
+    Returns:
+        Tuple of (maturities, yields)
+    """
+    if not max_points or len(maturities) <= max_points:
+        return maturities, yields
+
+    indices = np.linspace(0, len(maturities) - 1, max_points, dtype=np.int64)
+
+    if isinstance(maturities, np.ndarray):
+        # Fancy indexing gathers the points in one pass; only the kept
+        # points are converted to Python floats
+        return maturities[indices].tolist(), np.asarray(yields)[indices].tolist()
+
+    # Gather from the stored lists in C; converting the dense lists to
+    # arrays first would cost more than the gather itself
+    indices = indices.tolist()
+    return list(map(maturities.__getitem__, indices)), list(map(yields.__getitem__, indices))
+
+
+def precompute_downsampled_curves(
+    maturities: Optional[Union[List[float], np.ndarray]],
+    yields: Optional[Union[List[float], np.ndarray]],
+    sizes: Tuple[int, ...]
+) -> Optional[Dict[str, Dict[str, List[float]]]]:
+    """
+    Downsample a dense curve once for each commonly requested size.
+
+    Args:
+        maturities: Dense maturities (None if the curve was not interpolated)
+        yields: Corresponding yields
+        sizes: max_points values to precompute
+
+    Returns:
+        Mapping of str(max_points) to {'maturities', 'yields'}, or None. Sizes
+        not smaller than the curve are omitted; the full curve serves them.
+    """
+    if maturities is None or yields is None or len(maturities) == 0 or len(yields) == 0:
+        return None
+
+    downsampled = {}
+    for size in sizes:
+        if len(maturities) > size:
+            sampled_maturities, sampled_yields = downsample_curve(maturities, yields, size)
+            downsampled[str(size)] = {'maturities': sampled_maturities, 'yields': sampled_yields}
+
+    return downsampled
+
+
 def validate_curve_data(
     maturities: List[float],
     yields: List[float],
@@ -256,23 +468,26 @@ def validate_curve_data(
 
     # Check for valid numbers
     try:
-        maturities = np.array(maturities, dtype=float)
-        yields = np.array(yields, dtype=float)
+        maturities = np.asarray(maturities, dtype=np.float64)
+        yields = np.asarray(yields, dtype=np.float64)
     except (ValueError, TypeError):
         return False, "Maturities and yields must be numeric"
 
+    # One mask of usable (finite) points serves every check below
+    valid = np.isfinite(maturities) & np.isfinite(yields)
+    valid_maturities = maturities[valid]
+
     # Check for negative maturities
-    if np.any(maturities < 0):
+    if (valid_maturities < 0).any():
         return False, "Maturities cannot be negative"
 
-    # Count valid (non-NaN) points
-    valid_count = np.sum(~(np.isnan(maturities) | np.isnan(yields)))
+    # Count valid points
+    valid_count = valid_maturities.size
     if valid_count < min_points:
         return False, f"Insufficient valid data points (need at least {min_points})"
 
     # Check for duplicate maturities
-    unique_maturities = np.unique(maturities[~np.isnan(maturities)])
-    if len(unique_maturities) < valid_count:
+    if np.unique(valid_maturities).size < valid_count:
         return False, "Duplicate maturities detected"
 
     return True, ""
@@ -0,0 +1,155 @@
+"""
+In-process response cache for the API workers, and a small on-disk cache.
+"""
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import config
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of computed responses.
+
+    The data refresh runs in a separate process, so entries are tied to the
+    modification time of config.REFRESH_MARKER_PATH: once a refresh completes
+    every cached response is dropped. The TTL only bounds staleness if a
+    refresh changes data without finishing.
+
+    Cached values are shared between requests and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int, marker_path=config.REFRESH_MARKER_PATH):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            marker_path: File whose modification time marks a data refresh
+        """
+        self.maxsize = maxsize
+        self.marker_path = marker_path
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generation: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _current_generation(self) -> int:
+        try:
+            return os.stat(self.marker_path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], ttl: float) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        None results (nothing found) are not cached.
+
+        Args:
+            key: Hashable cache key
+            compute: Zero-argument callable producing the value
+            ttl: Seconds the value may be served from cache
+
+        Returns:
+            Cached or freshly computed value
+        """
+        generation = self._current_generation()
+        now = time.monotonic()
+
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = compute()
+
+        if value is not None:
+            with self._lock:
+                self._entries[key] = (now + ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """
+    Pickled values stored as one file per key under a directory.
+
+    Entries survive restarts and expire after their own TTL, or never when
+    stored without one. Only values this application wrote itself may be
+    loaded, since the files are unpickled.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Directory holding the cache files (created on first write)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: Hashable) -> Path:
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return self.directory / f"{digest}.pkl"
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Return the stored value for key.
+
+        Args:
+            key: Cache key with a stable repr
+
+        Returns:
+            Stored value, or None if missing, expired or unreadable
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store value for key, replacing any previous entry.
+
+        Written to a temporary file and renamed into place, so concurrent
+        readers never load a partial entry. Write failures are ignored.
+
+        Args:
+            key: Cache key with a stable repr
+            value: Picklable value
+            ttl: Seconds the entry stays valid, or None to keep it indefinitely
+        """
+        path = self._path(key)
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
@@ -1,12 +1,27 @@
 """
 Logging configuration.
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import colorlog
 import config
 
+# Background thread that formats records and writes them to the handlers
+_listener: QueueListener = None
+_queue_handler: QueueHandler = None
+
+
+def _stop_listener():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(log_level: str = None):
     """
@@ -49,14 +64,31 @@ def setup_logging(log_level: str = None):
     file_handler.setLevel(log_level)
     file_handler.setFormatter(file_formatter)
 
-    # Root logger
+    # Callers only enqueue records; formatting and console/file I/O run on
+    # the listener thread so logging in hot loops does not block on disk
+    global _listener, _queue_handler
     root_logger = logging.getLogger()
+    if _listener is None:
+        atexit.register(_stop_listener)
+    else:
+        root_logger.removeHandler(_queue_handler)
+        _stop_listener()
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    _queue_handler = QueueHandler(log_queue)
+
+    # Root logger
     root_logger.setLevel(log_level)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(_queue_handler)
 
     # Reduce noise from some libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
+    # httpx logs every request URL at INFO, which includes the FRED api_key
+    logging.getLogger('httpx').setLevel(logging.WARNING)
     logging.getLogger('apscheduler').setLevel(logging.INFO)
     logging.getLogger('sqlalchemy').setLevel(logging.WARNING)
 
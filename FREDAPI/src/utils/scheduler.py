@@ -1,19 +1,138 @@
 """
 Scheduler for automatic data refresh.
 """
-from datetime import datetime, timedelta, date
+import asyncio
+from datetime import datetime, timedelta, timezone, date
+from functools import cached_property
+from typing import IO, Awaitable, Callable, Dict, Optional, Tuple
+import json
+import os
+import threading
+import traceback
+import pandas as pd
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import func, insert, update
 import logging
 
 import config
-from src.models.database import SessionLocal, DataUpdateLog
-from src.data.fred_client import FREDClient
+from src.models.database import SessionLocal, DataUpdateLog, RawYieldData, engine
+from src.data.fred_client import FREDClient, redact_api_key, safe_error_message
 from src.data.treasury_builder import TreasuryCurveBuilder
 from src.data.corporate_builder import CorporateCurveBuilder
 
 logger = logging.getLogger(__name__)
 
+# Scheduler that runs the persisted daily job in this process
+_active_scheduler: Optional["DataRefreshScheduler"] = None
+
+
+def _acquire_leader_lock(lock_path) -> Optional[IO]:
+    """
+    Try to take the exclusive, non-blocking refresh leader lock.
+
+    Only one process on the host may run the daily refresh; any other
+    scheduler started against the same database stays idle. The lock is
+    released by the OS when the holder exits, even after a crash.
+
+    Args:
+        lock_path: Path of the lock file
+
+    Returns:
+        Open lock file handle if acquired (keep it open), otherwise None
+    """
+    lock_file = open(lock_path, 'a+')
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def _index_date_range(df: pd.DataFrame) -> Tuple[date, date]:
+    """
+    First and last date of a non-empty DataFrame's DatetimeIndex.
+
+    Reduces the underlying datetime64 array directly rather than going
+    through the Index min/max wrappers.
+
+    Args:
+        df: DataFrame indexed by date
+
+    Returns:
+        Tuple of (first_date, last_date)
+    """
+    values = df.index.values
+    return pd.Timestamp(values.min()).date(), pd.Timestamp(values.max()).date()
+
+
+def _failed_log_values(error: BaseException) -> Dict:
+    """
+    DataUpdateLog column values recording a failed update.
+
+    The message keeps the exception type, and the traceback (cause chain
+    included) is stored too, so failures can be diagnosed without a re-run.
+
+    Args:
+        error: Exception that ended the update
+
+    Returns:
+        Column values for _finish_update_log
+    """
+    return {
+        'status': 'failed',
+        'end_time': datetime.now(timezone.utc),
+        'error_message': redact_api_key(
+            ''.join(traceback.format_exception_only(type(error), error)).strip()
+        )[:500],
+        # Keep the end of long tracebacks, where the failing frame is
+        'error_traceback': redact_api_key(
+            ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+        )[-config.ERROR_TRACEBACK_MAX_CHARS:],
+    }
+
+
+def _run_daily_refresh():
+    """
+    Entry point of the persisted daily refresh job.
+
+    Job stores keep a textual reference to the job callable, so the job
+    points at this module-level function rather than a bound method.
+    """
+    if _active_scheduler is None:
+        logger.warning("Daily refresh fired without an active scheduler")
+        return
+    _active_scheduler.refresh_all_data()
+
+
+def _run_manual_refresh():
+    """Entry point of the one-off job queued by submit_queued_refresh."""
+    if _active_scheduler is None:
+        logger.warning("Manual refresh fired without an active scheduler")
+        return
+    _active_scheduler.refresh_all_data(force=True)
+
+
+def _run_issuer_refresh(issuer_id: str):
+    """
+    Entry point of the persisted per-issuer refresh jobs.
+
+    Args:
+        issuer_id: Corporate series name to refresh
+    """
+    if _active_scheduler is None:
+        logger.warning(f"Refresh of issuer {issuer_id} fired without an active scheduler")
+        return
+    _active_scheduler.refresh_issuer_data(issuer_id)
+
 
 class DataRefreshScheduler:
     """Scheduler for automatic data refresh."""
@@ -26,8 +145,29 @@ class DataRefreshScheduler:
             fred_api_key: FRED API key
         """
         self.fred_api_key = fred_api_key
-        self.scheduler = BackgroundScheduler()
+        # Jobs persist in the database so a refresh missed while the process
+        # was down runs once on restart (within the misfire grace time)
+        self.scheduler = BackgroundScheduler(
+            jobstores={'default': SQLAlchemyJobStore(engine=engine)},
+            job_defaults={
+                'coalesce': True,
+                'misfire_grace_time': config.REFRESH_MISFIRE_GRACE_SECONDS,
+            }
+        )
         self.is_running = False
+        self._leader_lock: Optional[IO] = None
+        # Held while any refresh runs, so overlapping runs are dropped
+        self._refresh_lock = threading.Lock()
+
+    @cached_property
+    def fred_client(self) -> FREDClient:
+        """
+        FRED client shared by every refresh run of this scheduler.
+
+        The client is created on first use and kept, so the API key is
+        validated once per process rather than at the start of every run.
+        """
+        return FREDClient(self.fred_api_key)
 
     def start(self):
         """Start the scheduler."""
@@ -35,18 +175,27 @@ class DataRefreshScheduler:
             logger.warning("Scheduler is already running")
             return
 
+        self._leader_lock = _acquire_leader_lock(config.SCHEDULER_LOCK_PATH)
+        if self._leader_lock is None:
+            logger.info("Another scheduler holds the refresh lock; not scheduling refreshes here")
+            return
+
         # Schedule daily refresh
         trigger = CronTrigger(
             hour=config.REFRESH_HOUR,
             minute=config.REFRESH_MINUTE
         )
 
+        global _active_scheduler
+        _active_scheduler = self
+
         self.scheduler.add_job(
-            self.refresh_all_data,
+            _run_daily_refresh,
             trigger=trigger,
             id='daily_refresh',
             name='Daily data refresh',
-            replace_existing=True
+            replace_existing=True,
+            max_instances=1
         )
 
         self.scheduler.start()
@@ -56,148 +205,525 @@ class DataRefreshScheduler:
             f"Scheduler started. Daily refresh at {config.REFRESH_HOUR:02d}:{config.REFRESH_MINUTE:02d}"
         )
 
+    def add_issuer_refresh(self, issuer_id: str, hour: int, minute: int):
+        """
+        Schedule a daily refresh of a single corporate series.
+
+        Jobs are kept in the persistent job store, which loads them by next
+        run time, so one job per issuer stays cheap as the number of issuers
+        grows. Re-adding an issuer replaces its schedule.
+
+        Args:
+            issuer_id: Corporate series name (a key of config.CORPORATE_SERIES)
+            hour: Hour of the daily refresh
+            minute: Minute of the daily refresh
+
+        Raises:
+            ValueError: If issuer_id is not a configured corporate series
+        """
+        if issuer_id not in config.CORPORATE_SERIES:
+            raise ValueError(f"Unknown corporate series: {issuer_id}")
+
+        self.scheduler.add_job(
+            _run_issuer_refresh,
+            trigger=CronTrigger(hour=hour, minute=minute),
+            args=[issuer_id],
+            id=f'issuer_{issuer_id}',
+            name=f'Daily refresh of {issuer_id}',
+            replace_existing=True,
+            max_instances=1
+        )
+
+        logger.info(f"Scheduled refresh of {issuer_id} at {hour:02d}:{minute:02d}")
+
+    def submit_queued_refresh(self) -> bool:
+        """
+        Queue a manual refresh of all data to run as soon as possible.
+
+        The run is forced: it does not wait out the freshness window of the
+        daily refresh. Requests made while one is still queued collapse into
+        that single run, and the run itself is dropped if a refresh is
+        already in progress.
+
+        Returns:
+            True if a refresh is queued, False if this scheduler is not running
+        """
+        if not self.is_running:
+            logger.warning("Scheduler is not running; manual refresh not queued")
+            return False
+
+        self.scheduler.add_job(
+            _run_manual_refresh,
+            id='manual_refresh',
+            name='Manual data refresh',
+            replace_existing=True,
+            max_instances=1
+        )
+
+        logger.info("Manual refresh queued")
+        return True
+
     def stop(self):
         """Stop the scheduler."""
         if not self.is_running:
             return
 
+        global _active_scheduler
         self.scheduler.shutdown(wait=False)
         self.is_running = False
+        if _active_scheduler is self:
+            _active_scheduler = None
+
+        if self._leader_lock is not None:
+            self._leader_lock.close()
+            self._leader_lock = None
+
         logger.info("Scheduler stopped")
 
-    def refresh_all_data(self):
+    def refresh_all_data(self, force: bool = False):
         """
         Refresh all data (Treasury and Corporate).
         This is the main scheduled task.
+
+        Returns immediately if another refresh is already running.
+
+        Args:
+            force: Run even if a scheduled refresh succeeded within
+                config.REFRESH_COALESCE_SECONDS, and log the run as
+                'manual_refresh'
         """
-        logger.info("Starting scheduled data refresh...")
+        if not self._refresh_lock.acquire(blocking=False):
+            logger.info("Refresh already running; refresh skipped")
+            return
+        try:
+            self._refresh_all_data(force)
+        finally:
+            self._refresh_lock.release()
 
-        start_time = datetime.utcnow()
+    def _refresh_all_data(self, force: bool = False):
+        """
+        Run a refresh of all data; the caller holds the refresh lock.
+
+        Args:
+            force: Manual refresh; skip the freshness check and log it as such
+        """
+        update_type = 'manual_refresh' if force else 'scheduled_refresh'
+        label = 'Manual' if force else 'Scheduled'
+        logger.info(f"Starting {label.lower()} data refresh...")
+
+        start_time = datetime.now(timezone.utc)
         db = SessionLocal()
+        log_id = None
 
         try:
+            if not force and self._refreshed_recently(db, start_time):
+                logger.info("Scheduled refresh skipped (already fresh)")
+                return
+
             # Create update log entry
-            update_log = DataUpdateLog(
-                update_type='scheduled_refresh',
-                status='running',
-                start_time=start_time,
-                log_metadata={'scheduled': True}
-            )
-            db.add(update_log)
-            db.commit()
+            log_metadata = {'manual': True} if force else {'scheduled': True}
+            log_id = self._start_update_log(db, update_type, start_time, log_metadata)
+
+            fred_client = self.fred_client
 
-            # Initialize FRED client
-            fred_client = FREDClient(self.fred_api_key)
+            # Fetch from just before the latest stored date (to capture any revisions)
+            end_date = date.today()
+            treasury_start = self._refresh_start_date(db, 'treasury', end_date)
+            corporate_start = self._refresh_start_date(db, 'corporate', end_date)
+            frames = self._fetch_concurrently({
+                'Treasury': lambda: fred_client.fetch_treasury_data_async(
+                    start_date=treasury_start.isoformat(),
+                    end_date=end_date.isoformat()
+                ),
+                'Corporate': lambda: fred_client.fetch_corporate_data_async(
+                    start_date=corporate_start.isoformat(),
+                    end_date=end_date.isoformat()
+                ),
+            })
 
             # Refresh Treasury data
-            treasury_success, treasury_failed = self._refresh_treasury_data(fred_client, db)
+            treasury_success, treasury_failed = self._refresh_treasury_data(
+                frames['Treasury'], db, treasury_start, end_date
+            )
 
-            # Refresh Corporate data
-            corporate_success, corporate_failed = self._refresh_corporate_data(fred_client, db)
+            # Refresh Corporate data (spreads are built against the Treasury curves)
+            corporate_success, corporate_failed = self._refresh_corporate_data(
+                frames['Corporate'], db, corporate_start, end_date
+            )
 
             # Update log
-            end_time = datetime.utcnow()
+            end_time = datetime.now(timezone.utc)
             total_success = treasury_success + corporate_success
             total_failed = treasury_failed + corporate_failed
 
-            update_log.end_time = end_time
-            update_log.status = 'success' if total_failed == 0 else 'partial'
-            update_log.records_processed = total_success + total_failed
-            update_log.records_updated = total_success
-            update_log.records_failed = total_failed
-            update_log.log_metadata = {
-                'scheduled': True,
+            log_metadata.update({
                 'treasury_success': treasury_success,
                 'treasury_failed': treasury_failed,
                 'corporate_success': corporate_success,
                 'corporate_failed': corporate_failed,
                 'duration_seconds': (end_time - start_time).total_seconds(),
+            })
+            log_values = {
+                'end_time': end_time,
+                'status': 'success' if total_failed == 0 else 'partial',
+                'records_processed': total_success + total_failed,
+                'records_updated': total_success,
+                'records_failed': total_failed,
+                'log_metadata': log_metadata,
             }
-
-            db.commit()
+            self._finish_update_log(db, log_id, log_values)
+            self._write_refresh_marker(update_type, start_time, log_values)
 
             logger.info(
-                f"Scheduled refresh complete. "
+                f"{label} refresh complete. "
                 f"Success: {total_success}, Failed: {total_failed}, "
                 f"Duration: {(end_time - start_time).total_seconds():.1f}s"
             )
 
         except Exception as e:
-            logger.error(f"Scheduled refresh failed: {str(e)}")
+            logger.error(f"{label} refresh failed: {str(e)}")
 
-            if 'update_log' in locals():
-                update_log.status = 'failed'
-                update_log.end_time = datetime.utcnow()
-                update_log.error_message = str(e)[:500]
-                db.commit()
+            if log_id is not None:
+                db.rollback()
+                self._finish_update_log(db, log_id, _failed_log_values(e))
 
         finally:
             db.close()
 
-    def _refresh_treasury_data(self, fred_client: FREDClient, db) -> tuple:
+    def _refreshed_recently(self, db, now: datetime) -> bool:
         """
-        Refresh Treasury data.
+        Check whether a scheduled refresh succeeded within config.REFRESH_COALESCE_SECONDS.
+
+        A refresh that fires twice in a row (coalesced or triggered by hand)
+        would otherwise repeat the same fetch and rebuild.
+
+        Args:
+            db: Database session
+            now: Start time of the refresh being considered
 
         Returns:
-            Tuple of (successful_count, failed_count)
+            True if the refresh can be skipped
         """
-        logger.info("Refreshing Treasury data...")
+        last_end_time = db.query(DataUpdateLog.end_time).filter(
+            DataUpdateLog.update_type == 'scheduled_refresh',
+            DataUpdateLog.status == 'success',
+            DataUpdateLog.end_time.isnot(None)
+        ).order_by(DataUpdateLog.end_time.desc()).limit(1).scalar()
 
+        if last_end_time is None:
+            return False
+        # SQLite returns stored timestamps without their (UTC) offset
+        if last_end_time.tzinfo is None:
+            last_end_time = last_end_time.replace(tzinfo=timezone.utc)
+        return (now - last_end_time).total_seconds() < config.REFRESH_COALESCE_SECONDS
+
+    def _refresh_start_date(
+        self,
+        db,
+        data_type: str,
+        end_date: date,
+        series_name: Optional[str] = None
+    ) -> date:
+        """
+        First date a refresh needs to fetch.
+
+        Observations before the latest stored date are already in the
+        database, so only config.REFRESH_REVISION_DAYS before it are fetched
+        again to pick up revisions, never more than
+        config.REFRESH_LOOKBACK_DAYS. The watermark is the stalest series'
+        latest date, so a series lagging behind the others is back-filled.
+        Without stored data the full lookback is fetched.
+
+        Args:
+            db: Database session
+            data_type: 'treasury' or 'corporate'
+            end_date: Last date of the refresh window
+            series_name: Restrict the watermark to one series
+
+        Returns:
+            Start date of the refresh window
+        """
+        # Latest date per series, read from the (data_type, series_name, date) index
+        query = db.query(func.max(RawYieldData.date).label('latest_date')).filter(
+            RawYieldData.data_type == data_type
+        )
+        if series_name is not None:
+            query = query.filter(RawYieldData.series_name == series_name)
+        per_series = query.group_by(RawYieldData.series_name).subquery()
+        latest_date = db.query(func.min(per_series.c.latest_date)).scalar()
+
+        start_date = end_date - timedelta(days=config.REFRESH_LOOKBACK_DAYS)
+        if latest_date is None:
+            return start_date
+        return max(latest_date - timedelta(days=config.REFRESH_REVISION_DAYS), start_date)
+
+    def refresh_issuer_data(self, issuer_id: str):
+        """
+        Refresh a single corporate series and rebuild the affected curves.
+
+        Returns immediately if another refresh is already running.
+
+        Args:
+            issuer_id: Corporate series name to refresh
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            logger.info(f"Refresh already running; refresh of {issuer_id} skipped")
+            return
         try:
-            # Fetch last 30 days of data (to capture any revisions)
+            self._refresh_issuer_data(issuer_id)
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh_issuer_data(self, issuer_id: str):
+        """
+        Run a refresh of one corporate series; the caller holds the refresh lock.
+
+        Args:
+            issuer_id: Corporate series name to refresh
+        """
+        logger.info(f"Starting refresh of {issuer_id}...")
+
+        start_time = datetime.now(timezone.utc)
+        db = SessionLocal()
+        log_id = None
+
+        try:
+            log_metadata = {'issuer': issuer_id}
+            log_id = self._start_update_log(db, 'issuer_refresh', start_time, log_metadata)
+
+            fred_client = self.fred_client
+
+            # Same revision window as the daily refresh
             end_date = date.today()
-            start_date = end_date - timedelta(days=30)
+            start_date = self._refresh_start_date(db, 'corporate', end_date, issuer_id)
+            frames = self._fetch_concurrently({
+                issuer_id: lambda: fred_client.fetch_corporate_data_async(
+                    start_date=start_date.isoformat(),
+                    end_date=end_date.isoformat(),
+                    series_names=[issuer_id]
+                ),
+            })
+
+            # Corporate curves combine every series, so the window is rebuilt
+            successful, failed = self._refresh_corporate_data(
+                frames[issuer_id], db, start_date, end_date
+            )
+
+            end_time = datetime.now(timezone.utc)
+            log_metadata.update({
+                'corporate_success': successful,
+                'corporate_failed': failed,
+                'duration_seconds': (end_time - start_time).total_seconds(),
+            })
+            log_values = {
+                'end_time': end_time,
+                'status': 'success' if failed == 0 else 'partial',
+                'records_processed': successful + failed,
+                'records_updated': successful,
+                'records_failed': failed,
+                'log_metadata': log_metadata,
+            }
+            self._finish_update_log(db, log_id, log_values)
+            self._write_refresh_marker('issuer_refresh', start_time, log_values)
+
+            logger.info(
+                f"Refresh of {issuer_id} complete. "
+                f"Success: {successful}, Failed: {failed}, "
+                f"Duration: {(end_time - start_time).total_seconds():.1f}s"
+            )
+
+        except Exception as e:
+            logger.error(f"Refresh of {issuer_id} failed: {str(e)}")
+
+            if log_id is not None:
+                db.rollback()
+                self._finish_update_log(db, log_id, _failed_log_values(e))
+
+        finally:
+            db.close()
+
+    def _start_update_log(self, db, update_type: str, start_time: datetime, metadata: Dict) -> int:
+        """
+        Insert a 'running' DataUpdateLog row and commit it.
+
+        The log is a flat status row, so it is written with Core statements
+        rather than through the ORM unit of work.
+
+        Args:
+            db: Database session
+            update_type: Kind of update being logged
+            start_time: Start time of the update
+            metadata: Initial log_metadata
+
+        Returns:
+            Id of the new log row
+        """
+        log_id = db.execute(
+            insert(DataUpdateLog).returning(DataUpdateLog.id),
+            {
+                'update_type': update_type,
+                'status': 'running',
+                'start_time': start_time,
+                'log_metadata': metadata,
+            }
+        ).scalar_one()
+        db.commit()
+        return log_id
+
+    def _finish_update_log(self, db, log_id: int, values: Dict):
+        """
+        Update a DataUpdateLog row created by _start_update_log and commit it.
+
+        Args:
+            db: Database session
+            log_id: Id of the log row
+            values: Column values to set
+        """
+        db.execute(update(DataUpdateLog).where(DataUpdateLog.id == log_id).values(**values))
+        db.commit()
+
+    def _write_refresh_marker(self, update_type: str, start_time: datetime, log_values: Dict):
+        """
+        Record the latest completed refresh in config.REFRESH_MARKER_PATH.
+
+        The scheduler runs in its own process, so the API reads this file to
+        report freshness. It is written to a temporary file and renamed into
+        place so readers never see a partial document.
+
+        Args:
+            update_type: Kind of update that completed
+            start_time: Start time of the update
+            log_values: Final column values of its log row
+        """
+        marker = {
+            'update_type': update_type,
+            'status': log_values['status'],
+            'start_time': start_time.isoformat(),
+            'end_time': log_values['end_time'].isoformat(),
+            'records_updated': log_values['records_updated'],
+        }
 
-            df = fred_client.fetch_treasury_data(
-                start_date=start_date.isoformat(),
-                end_date=end_date.isoformat()
+        try:
+            tmp_path = config.REFRESH_MARKER_PATH.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(marker))
+            os.replace(tmp_path, config.REFRESH_MARKER_PATH)
+        except OSError as e:
+            logger.warning(f"Failed to write refresh marker: {str(e)}")
+
+    def _fetch_concurrently(
+        self,
+        fetches: Dict[str, Callable[[], Awaitable[pd.DataFrame]]]
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Run independent FRED fetches at the same time.
+
+        The fetches are dominated by FRED latency, so every series of every
+        fetch is requested together on one event loop and the total takes
+        about as long as the slowest request. Storing and building stay on
+        the caller's session.
+
+        Args:
+            fetches: Mapping of label to zero-argument async fetch callable
+
+        Returns:
+            Mapping of label to fetched DataFrame, or None if that fetch failed
+        """
+        async def gather():
+            return await asyncio.gather(
+                *(fetch() for fetch in fetches.values()),
+                return_exceptions=True
             )
 
-            # Store raw data
+        frames = {}
+        for label, result in zip(fetches, asyncio.run(gather())):
+            if isinstance(result, Exception):
+                logger.error(f"{label} data fetch failed: {safe_error_message(result)}")
+                frames[label] = None
+            else:
+                frames[label] = result
+        return frames
+
+    def _refresh_treasury_data(
+        self,
+        df: Optional[pd.DataFrame],
+        db,
+        start_date: date,
+        end_date: date
+    ) -> tuple:
+        """
+        Refresh Treasury data.
+
+        Args:
+            df: Fetched Treasury data, or None if the fetch failed
+            db: Database session
+            start_date: First date of the refresh window
+            end_date: Last date of the refresh window
+
+        Returns:
+            Tuple of (successful_count, failed_count)
+        """
+        logger.info("Refreshing Treasury data...")
+
+        if df is None:
+            return 0, 1
+
+        try:
+            # Raw data and monthly blocks are committed together with the curves
             builder = TreasuryCurveBuilder(db)
-            builder.store_raw_data(df)
+            builder.store_raw_data(df, commit=False)
+            builder.store_monthly_blocks(start_date, end_date, commit=False)
 
             # Build curves
-            successful, failed = builder.build_curves_for_date_range(start_date, end_date)
+            successful, failed = builder.build_curves_for_date_range(start_date, end_date, commit=False)
+            db.commit()
 
             logger.info(f"Treasury refresh: {successful} curves built, {failed} failed")
             return successful, failed
 
         except Exception as e:
             logger.error(f"Treasury data refresh failed: {str(e)}")
+            db.rollback()
             return 0, 1
 
-    def _refresh_corporate_data(self, fred_client: FREDClient, db) -> tuple:
+    def _refresh_corporate_data(
+        self,
+        df: Optional[pd.DataFrame],
+        db,
+        start_date: date,
+        end_date: date
+    ) -> tuple:
         """
         Refresh Corporate data.
 
+        Args:
+            df: Fetched Corporate data, or None if the fetch failed
+            db: Database session
+            start_date: First date of the refresh window
+            end_date: Last date of the refresh window
+
         Returns:
             Tuple of (successful_count, failed_count)
         """
         logger.info("Refreshing Corporate data...")
 
-        try:
-            # Fetch last 30 days of data
-            end_date = date.today()
-            start_date = end_date - timedelta(days=30)
-
-            df = fred_client.fetch_corporate_data(
-                start_date=start_date.isoformat(),
-                end_date=end_date.isoformat()
-            )
+        if df is None:
+            return 0, 1
 
-            # Store raw data
+        try:
+            # Raw data is committed together with the curves
             builder = CorporateCurveBuilder(db)
-            builder.store_raw_data(df)
+            builder.store_raw_data(df, commit=False)
 
             # Build curves
-            successful, failed = builder.build_curves_for_date_range(start_date, end_date)
+            successful, failed = builder.build_curves_for_date_range(start_date, end_date, commit=False)
+            db.commit()
 
             logger.info(f"Corporate refresh: {successful} curves built, {failed} failed")
             return successful, failed
 
         except Exception as e:
             logger.error(f"Corporate data refresh failed: {str(e)}")
+            db.rollback()
             return 0, 1
 
     def run_initial_load(self):
@@ -207,75 +733,84 @@ class DataRefreshScheduler:
         """
         logger.info("Starting initial data load...")
 
-        start_time = datetime.utcnow()
+        start_time = datetime.now(timezone.utc)
         db = SessionLocal()
+        log_id = None
 
         try:
             # Create update log
-            update_log = DataUpdateLog(
-                update_type='initial_load',
-                status='running',
-                start_time=start_time,
-                log_metadata={'initial_load': True}
-            )
-            db.add(update_log)
-            db.commit()
-
-            # Initialize FRED client
-            fred_client = FREDClient(self.fred_api_key)
-
-            # Load all Treasury data
-            logger.info("Loading all Treasury data...")
-            treasury_df = fred_client.fetch_treasury_data()
+            log_metadata = {'initial_load': True}
+            log_id = self._start_update_log(db, 'initial_load', start_time, log_metadata)
+
+            fred_client = self.fred_client
+
+            # Load all Treasury and Corporate data
+            logger.info("Loading all Treasury and Corporate data...")
+            frames = self._fetch_concurrently({
+                'Treasury': fred_client.fetch_treasury_data_async,
+                'Corporate': fred_client.fetch_corporate_data_async,
+            })
+            if frames['Treasury'] is None or frames['Corporate'] is None:
+                raise ValueError("Initial FRED fetch failed")
+            treasury_df = frames['Treasury']
+            corporate_df = frames['Corporate']
+
+            # Raw data, monthly blocks and curves of each data set are committed together
             treasury_builder = TreasuryCurveBuilder(db)
-            treasury_builder.store_raw_data(treasury_df)
+            treasury_builder.store_raw_data(treasury_df, commit=False)
 
             # Build Treasury curves
             if len(treasury_df) > 0:
-                start_date = treasury_df.index.min().date()
-                end_date = treasury_df.index.max().date()
+                start_date, end_date = _index_date_range(treasury_df)
+                treasury_builder.store_monthly_blocks(start_date, end_date, commit=False)
                 treasury_success, treasury_failed = treasury_builder.build_curves_for_date_range(
-                    start_date, end_date
+                    start_date, end_date, commit=False
                 )
             else:
                 treasury_success, treasury_failed = 0, 0
+            db.commit()
+
+            # Without Treasury curves there is nothing to build spreads over
+            build_spreads = len(treasury_df) > 0
+            if not build_spreads:
+                logger.warning("Treasury pull returned no data; building corporate curves without spreads")
 
-            # Load all Corporate data
-            logger.info("Loading all Corporate data...")
-            corporate_df = fred_client.fetch_corporate_data()
+            # Store Corporate data
             corporate_builder = CorporateCurveBuilder(db)
-            corporate_builder.store_raw_data(corporate_df)
+            corporate_builder.store_raw_data(corporate_df, commit=False)
 
             # Build Corporate curves
             if len(corporate_df) > 0:
-                start_date = corporate_df.index.min().date()
-                end_date = corporate_df.index.max().date()
+                start_date, end_date = _index_date_range(corporate_df)
                 corporate_success, corporate_failed = corporate_builder.build_curves_for_date_range(
-                    start_date, end_date
+                    start_date, end_date, commit=False, build_spreads=build_spreads
                 )
             else:
                 corporate_success, corporate_failed = 0, 0
+            db.commit()
 
             # Update log
-            end_time = datetime.utcnow()
+            end_time = datetime.now(timezone.utc)
             total_success = treasury_success + corporate_success
             total_failed = treasury_failed + corporate_failed
 
-            update_log.end_time = end_time
-            update_log.status = 'success' if total_failed == 0 else 'partial'
-            update_log.records_processed = total_success + total_failed
-            update_log.records_updated = total_success
-            update_log.records_failed = total_failed
-            update_log.log_metadata = {
-                'initial_load': True,
+            log_metadata.update({
                 'treasury_success': treasury_success,
                 'treasury_failed': treasury_failed,
                 'corporate_success': corporate_success,
                 'corporate_failed': corporate_failed,
                 'duration_seconds': (end_time - start_time).total_seconds(),
+            })
+            log_values = {
+                'end_time': end_time,
+                'status': 'success' if total_failed == 0 else 'partial',
+                'records_processed': total_success + total_failed,
+                'records_updated': total_success,
+                'records_failed': total_failed,
+                'log_metadata': log_metadata,
             }
-
-            db.commit()
+            self._finish_update_log(db, log_id, log_values)
+            self._write_refresh_marker('initial_load', start_time, log_values)
 
             logger.info(
                 f"Initial load complete. "
@@ -288,11 +823,9 @@ class DataRefreshScheduler:
         except Exception as e:
             logger.error(f"Initial load failed: {str(e)}")
 
-            if 'update_log' in locals():
-                update_log.status = 'failed'
-                update_log.end_time = datetime.utcnow()
-                update_log.error_message = str(e)[:500]
-                db.commit()
+            if log_id is not None:
+                db.rollback()
+                self._finish_update_log(db, log_id, _failed_log_values(e))
 
             return False
 